@@ -0,0 +1,37 @@
+"""
+Sparse signal forward fill
+==========================
+
+Vectorized "set on events, hold otherwise" fill shared by the strategies and
+features: build a sparse signal from event masks and carry the last event's value
+forward with ``np.maximum.accumulate`` over event indices.
+"""
+
+import numpy as np
+
+
+def ffill_sparse_signal(events_long, events_short, initial: int = 0, short_value: int = -1) -> np.ndarray:
+    """
+    Forward-fill long / short events into an int8 signal.
+    
+    Args:
+        events_long: Boolean mask of bars that set the signal to 1
+        events_short: Boolean mask of bars that set the signal to ``short_value``
+            (a long event on the same bar wins)
+        initial: Signal before the first event
+        short_value: Value set by short events (e.g. 0 for long-only exits)
+        
+    Returns:
+        Int8 signal, one value per bar
+    """
+    events_long = np.asarray(events_long, dtype=np.bool_)
+    is_event = events_long | np.asarray(events_short, dtype=np.bool_)
+    values = np.where(events_long, 1, short_value).astype(np.int8)
+    
+    # Index of the last event at or before each bar (-1 before the first one)
+    last_event = np.where(is_event, np.arange(len(is_event)), -1)
+    np.maximum.accumulate(last_event, out=last_event)
+    return np.where(last_event >= 0, values[last_event], initial).astype(np.int8)
+
+
+__all__ = ['ffill_sparse_signal']
@@ -0,0 +1,28 @@
+"""
+Optional Numba JIT
+==================
+
+``njit`` and ``prange`` resolve to Numba when it is installed
+(``pip install numba``); otherwise they fall back to no-ops so every kernel
+still runs as plain Python over NumPy arrays.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -0,0 +1,52 @@
+"""
+Numba kernel warm-up
+====================
+
+Every kernel is compiled with ``cache=True``, so Numba reuses the machine code it
+writes to ``__pycache__`` across processes. ``warm_kernels`` runs the public entry
+points once on a tiny synthetic data set, which compiles (or loads from that cache)
+exactly the type specializations real runs hit, e.g. read-only arrays viewed from
+polars. Call it once at the start of a research run or in CI; it is not run at
+import so importing the framework never pays a compile.
+"""
+
+import numpy as np
+import polars as pl
+
+from framework._njit import NUMBA_AVAILABLE
+
+
+def warm_kernels() -> None:
+    """Compile or load the cached Numba kernels (no-op without Numba)"""
+    if not NUMBA_AVAILABLE:
+        return
+
+    from framework.features import DonchianFeature, RSIFeature
+    from framework.performance import ProfitFactorMeasure
+    from framework.signals import PositionState, SignalChange, SignalManager
+    from framework.significance_testing import MonteCarloSignificanceTest
+    from framework.strategies._rsi_loop import rsi_breakout_positions
+
+    close = 100.0 + np.sin(np.arange(32, dtype=np.float64))
+    data = pl.DataFrame(
+        {"open": close, "high": close + 1.0, "low": close - 1.0, "close": close, "volume": np.ones(32)}
+    )
+
+    rsi = RSIFeature(data, period=3).get_values().to_numpy()
+    rsi_breakout_positions(rsi, 30.0, 70.0)
+
+    donchian = DonchianFeature(data, lookback=3)
+    donchian.get_breakout_position_grid([3])
+    donchian.get_breakout_profit_factors([3])
+
+    manager = SignalManager()
+    manager.generate_signals(pl.Series([SignalChange.NO_CHANGE, SignalChange.NEUTRAL_TO_LONG]))
+    manager.generate_signals(pl.Series([0, 1], dtype=pl.Int8), signal_type=PositionState)
+
+    returns = pl.Series(np.diff(np.log(close)))
+    ProfitFactorMeasure().calculate(returns)
+    MonteCarloSignificanceTest(n_permutations=2, random_seed=0).test(None, returns, metric='max_drawdown')
+    MonteCarloSignificanceTest._calculate_metric_np(returns.to_numpy(), 'profit_factor')
+
+
+__all__ = ['warm_kernels']
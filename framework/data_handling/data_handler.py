@@ -15,6 +15,17 @@ from typing import Dict, Any, Optional, List, Tuple
 from framework.data_handling.market_session import SessionPolicy, apply_session_policy
 
 
+def _year_range_mask(start_year: Optional[int], end_year: Optional[int]) -> pl.Expr:
+    """Rows with ``start_year <= timestamp year < end_year`` (a missing bound is open)"""
+    year = pl.col('timestamp').dt.year()
+    mask = pl.lit(True)
+    if start_year is not None:
+        mask = mask & (year >= start_year)
+    if end_year is not None:
+        mask = mask & (year < end_year)
+    return mask
+
+
 class DataHandler:
     """
     Handles market data loading, preprocessing, and validation.
@@ -47,21 +58,38 @@ class DataHandler:
         self.data = None
         self.features = {}
         
-    def load_data(self, **kwargs) -> pl.DataFrame:
-        """Load market data from file"""
+    def load_data(self, start_year: Optional[int] = None, end_year: Optional[int] = None, **kwargs) -> pl.DataFrame:
+        """Load market data from file
+
+        Parquet still has to decode its pages on every load. Uncompressed Arrow IPC
+        files (``.arrow``, ``.ipc``, ``.feather``) are mapped straight into memory,
+        so a frame saved once with ``write_ipc(path, compression='uncompressed')``
+        reloads from the page cache without decoding.
+
+        ``start_year`` / ``end_year`` apply the :meth:`filter_date_range` filter while
+        reading, so the predicate reaches the scan and rows (Parquet row groups)
+        outside the range are skipped instead of loaded and dropped.
+        """
         path_lower = self.data_path.lower()
         if path_lower.endswith((".pq", ".parquet")):
-            self.data = pl.read_parquet(self.data_path)
+            frame = pl.scan_parquet(self.data_path)
+        elif path_lower.endswith((".arrow", ".ipc", ".feather")):
+            frame = pl.scan_ipc(self.data_path)
         elif path_lower.endswith(".csv"):
-            self.data = pl.read_csv(self.data_path)
+            frame = pl.scan_csv(self.data_path)
         else:
-            raise ValueError("Unsupported file format. Use .parquet, .pq, or .csv")
+            raise ValueError("Unsupported file format. Use .parquet, .pq, .arrow, .ipc, .feather or .csv")
             
         # Convert timestamp to datetime if needed
-        if 'timestamp' in self.data.columns:
-            self.data = self.data.with_columns(
-                pl.col('timestamp').cast(pl.Datetime).alias('timestamp')
-            )
+        has_timestamp = 'timestamp' in frame.collect_schema().names()
+        if has_timestamp:
+            frame = frame.with_columns(pl.col('timestamp').cast(pl.Datetime).alias('timestamp'))
+        if start_year is not None or end_year is not None:
+            if not has_timestamp:
+                raise ValueError("No timestamp column found for date filtering")
+            frame = frame.filter(_year_range_mask(start_year, end_year))
+        self.data = frame.collect()
+        if has_timestamp:
             self.data = self.data.set_sorted('timestamp')
             
         # Standardize column names
@@ -88,10 +116,7 @@ class DataHandler:
             
         # Filter by year range
         if 'timestamp' in self.data.columns:
-            self.data = self.data.filter(
-                (pl.col('timestamp').dt.year() >= start_year) & 
-                (pl.col('timestamp').dt.year() < end_year)
-            )
+            self.data = self.data.filter(_year_range_mask(start_year, end_year))
         else:
             # If no timestamp column, assume index is datetime
             raise ValueError("No timestamp column found for date filtering")
@@ -8,7 +8,9 @@ and lowest low over a specified lookback period.
 
 import polars as pl
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from framework._ffill import ffill_sparse_signal
+from framework._njit import NUMBA_AVAILABLE, njit, prange
 from framework.features.base_feature import BaseFeature
 
 
@@ -39,6 +41,7 @@ class DonchianFeature(BaseFeature):
         # Set attributes before calling super().__init__ to avoid calculation issues
         self.lookback = lookback
         self.include_middle = include_middle
+        self._price_values = {}  # float64 price arrays, shared across lookback sweeps
         
         super().__init__(
             name="Donchian",
@@ -60,20 +63,13 @@ class DonchianFeature(BaseFeature):
         if not self.validate_data(self.data):
             raise ValueError("Data must contain OHLCV columns")
             
-        # Calculate Donchian bands
-        upper = self.data.select(pl.col('high').rolling_max(window_size=self.lookback).alias('upper'))
-        lower = self.data.select(pl.col('low').rolling_min(window_size=self.lookback).alias('lower'))
+        # Calculate Donchian bands (one rolling pass each; polars' rolling max/min
+        # are already sliding-window kernels)
+        if not self.include_middle:
+            # Default to upper band if middle not included
+            return self.data.select(pl.col('high').rolling_max(window_size=self.lookback).alias('upper'))['upper']
         
-        # Calculate middle band
-        middle = self.data.select(
-            ((pl.col('high').rolling_max(window_size=self.lookback) + 
-              pl.col('low').rolling_min(window_size=self.lookback)) / 2).alias('middle')
-        )
-        
-        if self.include_middle:
-            return middle['middle']
-        else:
-            return upper['upper']  # Default to upper band if middle not included
+        return self.get_bands()['middle']
     
     def get_bands(self) -> Dict[str, pl.Series]:
         """
@@ -94,7 +90,7 @@ class DonchianFeature(BaseFeature):
         ])
         
         # Calculate middle band
-        middle = (bands['upper'] + bands['lower']) / 2
+        middle = ((bands['upper'] + bands['lower']) / 2).alias('middle')
         
         return {
             'upper': bands['upper'],
@@ -102,6 +98,119 @@ class DonchianFeature(BaseFeature):
             'middle': middle
         }
     
+    def set_data(self, data: pl.DataFrame):
+        """Set data and recalculate feature values"""
+        self._price_values = {}
+        super().set_data(data)
+    
+    def _price_array(self, column: str) -> np.ndarray:
+        """Float64 NumPy view of a price column, converted once per data set"""
+        if column not in self._price_values:
+            self._price_values[column] = self.data[column].cast(pl.Float64).to_numpy()
+        return self._price_values[column]
+    
+    def _forward_returns(self) -> np.ndarray:
+        """Next-bar log returns of close (0 on the last bar and for non-finite values)"""
+        if 'forward' not in self._price_values:
+            close = self._price_array('close')
+            forward = np.zeros(len(close))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                forward[:-1] = np.diff(np.log(close))
+            forward[~np.isfinite(forward)] = 0.0
+            self._price_values['forward'] = forward
+        return self._price_values['forward']
+    
+    def get_breakout_positions(self, lookback: Optional[int] = None) -> pl.Series:
+        """
+        Get Donchian breakout positions using stored data.
+        
+        Goes long when close breaks above the prior bar's upper band and short when
+        it breaks below the prior bar's lower band, holding the position in between.
+        
+        Args:
+            lookback: Channel lookback to use instead of ``self.lookback``, so one
+                feature can sweep lookbacks without reconverting the close prices
+        
+        Returns:
+            Int8 series of positions (1 = long, -1 = short, 0 = before the first breakout)
+        """
+        if self.data is None:
+            raise ValueError("No data available for Donchian breakout positions")
+        
+        if lookback is None:
+            lookback = self.lookback
+        prior_bands = self.data.select([
+            pl.col('high').rolling_max(window_size=lookback).shift(1).cast(pl.Float64).alias('upper'),
+            pl.col('low').rolling_min(window_size=lookback).shift(1).cast(pl.Float64).alias('lower')
+        ])
+        
+        return pl.Series('position_signals', _breakout_positions(
+            self._price_array('close'), prior_bands['upper'].to_numpy(), prior_bands['lower'].to_numpy()
+        ))
+    
+    def get_breakout_position_grid(self, lookbacks) -> np.ndarray:
+        """
+        Get Donchian breakout positions for several lookbacks at once.
+        
+        With Numba each lookback runs on its own thread using O(n) monotonic-deque
+        bands; otherwise this stacks ``get_breakout_positions`` per lookback.
+        
+        Args:
+            lookbacks: Channel lookbacks to evaluate
+            
+        Returns:
+            Int8 array of shape (len(lookbacks), n_bars), one row per lookback
+        """
+        if self.data is None:
+            raise ValueError("No data available for Donchian breakout positions")
+        
+        lookbacks = np.asarray(lookbacks, dtype=np.int64).reshape(-1)
+        if (lookbacks < 1).any():
+            raise ValueError("Donchian lookbacks must be at least 1")
+            
+        if not NUMBA_AVAILABLE:
+            grid = np.empty((len(lookbacks), self.data.height), dtype=np.int8)
+            for k, lookback in enumerate(lookbacks):
+                grid[k] = self.get_breakout_positions(int(lookback)).to_numpy()
+            return grid
+        
+        return _breakout_position_grid(
+            self._price_array('close'), self._price_array('high'), self._price_array('low'), lookbacks
+        )
+    
+    def get_breakout_profit_factors(self, lookbacks) -> np.ndarray:
+        """
+        Get the profit factor of Donchian breakout positions for several lookbacks.
+        
+        Strategy returns are position times next-bar log return of close (0 on the
+        last bar), scored like ``ProfitFactorMeasure``. With Numba the bands, returns
+        and gross profit / loss are fused into one pass per lookback.
+        
+        Args:
+            lookbacks: Channel lookbacks to evaluate
+            
+        Returns:
+            Float array of profit factors, one per lookback (inf when nothing is lost)
+        """
+        if self.data is None:
+            raise ValueError("No data available for Donchian breakout profit factors")
+        
+        forward = self._forward_returns()
+        
+        if not NUMBA_AVAILABLE:
+            returns = self.get_breakout_position_grid(lookbacks) * forward
+            gross_profit = np.where(returns > 0, returns, 0.0).sum(axis=1)
+            gross_loss = np.where(returns < 0, -returns, 0.0).sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(gross_loss > 0, gross_profit / gross_loss, np.inf)
+        
+        lookbacks = np.asarray(lookbacks, dtype=np.int64).reshape(-1)
+        if (lookbacks < 1).any():
+            raise ValueError("Donchian lookbacks must be at least 1")
+        return _breakout_profit_factors(
+            self._price_array('close'), self._price_array('high'), self._price_array('low'), forward, lookbacks
+        )
+    
     def get_breakout_signals(self, data: pl.DataFrame, 
                            upper_threshold: float = 1.0,
                            lower_threshold: float = 1.0) -> Dict[str, pl.Series]:
@@ -158,3 +267,91 @@ class DonchianFeature(BaseFeature):
         )
         
         return position
+
+
+def _breakout_positions(close: np.ndarray, upper: np.ndarray, lower: np.ndarray) -> np.ndarray:
+    """Breakout positions forward-filled with NumPy (NaN bands never trigger)"""
+    return ffill_sparse_signal(close > upper, close < lower)
+
+
+@njit(cache=True, nogil=True)
+def _breakout_scan(close, high, low, lookback, forward, positions):
+    """
+    Single pass of Donchian breakouts against prior-bar bands kept in monotonic deques.
+    
+    Writes positions into ``positions`` unless it is empty, and accumulates gross
+    profit / loss of ``position * forward`` unless ``forward`` is empty, so a sweep
+    scores a lookback without materializing positions or returns.
+    
+    Like polars' rolling max / min, a band is undefined while its window holds a
+    NaN (nulls arrive here as NaN): NaN bars stay out of the deques and only
+    record where the band becomes valid again.
+    """
+    n = close.shape[0]
+    write_positions = positions.shape[0] > 0
+    score = forward.shape[0] > 0
+    max_queue = np.empty(n, dtype=np.int64)  # indices of decreasing highs
+    min_queue = np.empty(n, dtype=np.int64)  # indices of increasing lows
+    max_head = max_tail = min_head = min_tail = 0
+    last_nan_high = last_nan_low = -1
+    position = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    for i in range(n):
+        # The queues hold bars [i - lookback, i - 1]: the prior bar's bands
+        if i >= lookback:
+            if last_nan_high < i - lookback and close[i] > high[max_queue[max_head]]:
+                position = 1
+            elif last_nan_low < i - lookback and close[i] < low[min_queue[min_head]]:
+                position = -1
+        if write_positions:
+            positions[i] = position
+        if score:
+            r = position * forward[i]
+            if r > 0.0:
+                gross_profit += r
+            elif r < 0.0:
+                gross_loss -= r
+        
+        if np.isnan(high[i]):
+            last_nan_high = i
+        else:
+            while max_tail > max_head and high[max_queue[max_tail - 1]] <= high[i]:
+                max_tail -= 1
+            max_queue[max_tail] = i
+            max_tail += 1
+        if np.isnan(low[i]):
+            last_nan_low = i
+        else:
+            while min_tail > min_head and low[min_queue[min_tail - 1]] >= low[i]:
+                min_tail -= 1
+            min_queue[min_tail] = i
+            min_tail += 1
+        
+        # Drop bars that leave the window for bar i + 1
+        if max_tail > max_head and max_queue[max_head] <= i - lookback:
+            max_head += 1
+        if min_tail > min_head and min_queue[min_head] <= i - lookback:
+            min_head += 1
+    return gross_profit, gross_loss
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _breakout_position_grid(close, high, low, lookbacks):
+    """Breakout positions for every lookback, one row per lookback"""
+    out = np.empty((lookbacks.shape[0], close.shape[0]), dtype=np.int8)
+    no_forward = np.empty(0, dtype=np.float64)
+    for k in prange(lookbacks.shape[0]):
+        _breakout_scan(close, high, low, lookbacks[k], no_forward, out[k])
+    return out
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _breakout_profit_factors(close, high, low, forward, lookbacks):
+    """Profit factor of the breakout returns for every lookback (inf without losses)"""
+    out = np.empty(lookbacks.shape[0], dtype=np.float64)
+    no_positions = np.empty(0, dtype=np.int8)
+    for k in prange(lookbacks.shape[0]):
+        gross_profit, gross_loss = _breakout_scan(close, high, low, lookbacks[k], forward, no_positions)
+        out[k] = gross_profit / gross_loss if gross_loss > 0.0 else np.inf
+    return out
@@ -6,7 +6,7 @@ Moving Average Convergence Divergence: fast EMA minus slow EMA, signal EMA of th
 and histogram (MACD − signal). Built from :class:`EmaFeature` instances.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 import polars as pl
@@ -40,6 +40,8 @@ class MacdFeature(BaseFeature):
         self._macd_line: Optional[pl.Series] = None
         self._signal_line: Optional[pl.Series] = None
         self._histogram: Optional[pl.Series] = None
+        # Price EMAs by (column, period), reused while sweeping fast / slow periods
+        self._ema_cache: Dict[Tuple[str, int], pl.Series] = {}
 
         super().__init__(
             name="MACD",
@@ -58,12 +60,8 @@ class MacdFeature(BaseFeature):
         if self.column not in self.data.columns:
             raise ValueError(f"Column '{self.column}' not in data")
 
-        fast_ema = EmaFeature(
-            self.data, period=self.fast_period, column=self.column
-        ).get_values()
-        slow_ema = EmaFeature(
-            self.data, period=self.slow_period, column=self.column
-        ).get_values()
+        fast_ema = self._price_ema(self.fast_period)
+        slow_ema = self._price_ema(self.slow_period)
 
         macd_line = fast_ema - slow_ema
         signal_line = EmaFeature(
@@ -79,6 +77,26 @@ class MacdFeature(BaseFeature):
 
         return macd_line
 
+    def _price_ema(self, period: int) -> pl.Series:
+        key = (self.column, period)
+        if key not in self._ema_cache:
+            self._ema_cache[key] = EmaFeature(self.data, period=period, column=self.column).get_values()
+        return self._ema_cache[key]
+
+    def set_params(self, **params):
+        """Set MACD periods / column; price EMAs already computed for this data are reused."""
+        for name in ("fast_period", "slow_period", "signal_period"):
+            if name in params:
+                setattr(self, name, params[name])
+        if "column" in params:
+            params["column"] = self.column = validate_ohlc_price_column(params["column"])
+        self._macd_line = self._signal_line = self._histogram = None
+        super().set_params(**params)
+
+    def set_data(self, data: pl.DataFrame):
+        self._ema_cache = {}
+        super().set_data(data)
+
     def get_values(self, recalculate: bool = False) -> pl.Series:
         """MACD line (same as primary feature series)."""
         return super().get_values(recalculate=recalculate)
@@ -9,9 +9,32 @@ and magnitude of price changes.
 import polars as pl
 import numpy as np
 from typing import Dict, Any, Optional
+from framework._njit import NUMBA_AVAILABLE, njit
 from framework.features.base_feature import BaseFeature
 
 
+@njit(cache=True, nogil=True)
+def _wilder_rsi(price_changes, alpha):
+    """RSI from Wilder-smoothed gains / losses (ewm_mean(alpha, adjust=False)) in one pass"""
+    n = price_changes.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    avg_gains = 0.0
+    avg_losses = 0.0
+    for i in range(n):
+        change = price_changes[i]
+        # NaN counts as a gain, as in polars where NaN sorts above every number
+        gain = change if (change > 0.0 or np.isnan(change)) else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i == 0:
+            avg_gains = gain
+            avg_losses = loss
+        else:
+            avg_gains = (1.0 - alpha) * avg_gains + alpha * gain
+            avg_losses = (1.0 - alpha) * avg_losses + alpha * loss
+        out[i] = 100.0 if avg_losses == 0.0 else 100.0 - (100.0 / (1.0 + avg_gains / avg_losses))
+    return out
+
+
 class RSIFeature(BaseFeature):
     """
     Relative Strength Index (RSI) feature.
@@ -43,6 +66,9 @@ class RSIFeature(BaseFeature):
         self.period = period
         self.overbought = overbought
         self.oversold = oversold
+        # RSI per period for the current data, so period sweeps compute each one once
+        self._rsi_cache: Dict[int, pl.Series] = {}
+        self._rsi_cache_data = None
         
         super().__init__(name="RSI", data=data, period=period, overbought=overbought, oversold=oversold)
         
@@ -59,41 +85,57 @@ class RSIFeature(BaseFeature):
         if not self.validate_data(self.data):
             raise ValueError("Data must contain OHLCV columns")
             
-        # Calculate price changes
-        price_changes = self.data.select(
-            pl.col('close').diff().alias('price_change')
-        )
-        
-        # Separate gains and losses
-        gains_losses = price_changes.select([
-            pl.when(pl.col('price_change') > 0)
-            .then(pl.col('price_change'))
-            .otherwise(0)
-            .alias('gains'),
-            pl.when(pl.col('price_change') < 0)
-            .then(pl.col('price_change').abs())
-            .otherwise(0)
-            .alias('losses')
-        ])
+        if self._rsi_cache_data is not self.data:
+            self._rsi_cache = {}
+            self._rsi_cache_data = self.data
+        if self.period not in self._rsi_cache:
+            self._rsi_cache[self.period] = self._calculate_rsi()
+        return self._rsi_cache[self.period]
+    
+    def _calculate_rsi(self) -> pl.Series:
+        """RSI of ``self.data`` for the current period (uncached)"""
+        if NUMBA_AVAILABLE:
+            # Same smoothing as the expressions below, as one compiled pass
+            price_changes = self.data['close'].cast(pl.Float64).diff().fill_null(0.0).to_numpy()
+            return pl.Series('rsi', _wilder_rsi(price_changes, 1.0 / self.period))
+            
+        # Price changes, gains / losses, smoothing and RSI as one lazy query
+        price_change = pl.col('close').diff()
+        gains = pl.when(price_change > 0).then(price_change).otherwise(0)
+        losses = pl.when(price_change < 0).then(price_change.abs()).otherwise(0)
         
         # Calculate smoothed averages using exponential moving average
         alpha = 1.0 / self.period
-        rsi_data = gains_losses.with_columns([
-            pl.col('gains').ewm_mean(alpha=alpha, adjust=False).alias('avg_gains'),
-            pl.col('losses').ewm_mean(alpha=alpha, adjust=False).alias('avg_losses')
-        ])
+        avg_gains = gains.ewm_mean(alpha=alpha, adjust=False)
+        avg_losses = losses.ewm_mean(alpha=alpha, adjust=False)
         
         # Calculate RSI
-        rsi_values = rsi_data.select(
-            pl.when(pl.col('avg_losses') == 0)
-            .then(100.0)
-            .otherwise(
-                100.0 - (100.0 / (1.0 + pl.col('avg_gains') / pl.col('avg_losses')))
+        return (
+            self.data.lazy()
+            .select(
+                pl.when(avg_losses == 0)
+                .then(100.0)
+                .otherwise(100.0 - (100.0 / (1.0 + avg_gains / avg_losses)))
+                .alias('rsi')
             )
-            .alias('rsi')
+            .collect()
+            .to_series()
         )
+    
+    def set_params(self, **params):
+        """
+        Set feature parameters.
         
-        return rsi_values['rsi']
+        RSI values depend only on ``period``, so threshold-only changes (e.g. while
+        sweeping overbought/oversold levels) keep the calculated values.
+        """
+        period_changed = 'period' in params and params['period'] != self.period
+        for name in ('period', 'overbought', 'oversold'):
+            if name in params:
+                setattr(self, name, params[name])
+        self.params.update(params)
+        if period_changed:
+            self.is_calculated = False  # Mark for recalculation
     
     def get_overbought_signals(self, threshold: Optional[float] = None) -> pl.Series:
         """
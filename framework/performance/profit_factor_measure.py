@@ -7,9 +7,24 @@ Calculate profit factor (winning trades / losing trades).
 
 import polars as pl
 import numpy as np
+from framework._njit import njit
 from framework.performance.measures import BaseMeasure
 
 
+@njit(cache=True)
+def _gross_profit_loss(returns):
+    """Gross profit and gross loss (as a positive number) in one pass; NaNs are skipped"""
+    gross_profit = 0.0
+    gross_loss = 0.0
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if r > 0.0:
+            gross_profit += r
+        elif r < 0.0:
+            gross_loss -= r
+    return gross_profit, gross_loss
+
+
 class ProfitFactorMeasure(BaseMeasure):
     """Calculate profit factor"""
     
@@ -17,6 +32,5 @@ class ProfitFactorMeasure(BaseMeasure):
         super().__init__("Profit Factor")
     
     def calculate(self, returns: pl.Series, **kwargs) -> float:
-        winning_trades = returns.filter(returns > 0).sum()
-        losing_trades = returns.filter(returns < 0).abs().sum()
+        winning_trades, losing_trades = _gross_profit_loss(returns.cast(pl.Float64).to_numpy())
         return winning_trades / losing_trades if losing_trades > 0 else float('inf')
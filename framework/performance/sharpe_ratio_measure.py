@@ -20,4 +20,5 @@ class SharpeRatioMeasure(BaseMeasure):
     def calculate(self, returns: pl.Series, **kwargs) -> float:
         risk_free_rate = kwargs.get('risk_free_rate', self.risk_free_rate)
         excess_returns = returns.mean() - risk_free_rate
-        return excess_returns / returns.std() if returns.std() > 0 else 0
+        std = returns.std()
+        return excess_returns / std if std > 0 else 0
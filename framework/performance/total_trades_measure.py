@@ -17,4 +17,4 @@ class TotalTradesMeasure(BaseMeasure):
         super().__init__("Total Trades")
     
     def calculate(self, returns: pl.Series, **kwargs) -> int:
-        return len(returns.filter(returns != 0))
+        return (returns != 0).sum()
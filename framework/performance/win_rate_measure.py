@@ -17,6 +17,7 @@ class WinRateMeasure(BaseMeasure):
         super().__init__("Win Rate")
     
     def calculate(self, returns: pl.Series, **kwargs) -> float:
-        total_trades = len(returns.filter(returns != 0))
-        winning_trades = len(returns.filter(returns > 0))
+        # Count with boolean sums instead of materializing filtered Series
+        total_trades = (returns != 0).sum()
+        winning_trades = (returns > 0).sum()
         return winning_trades / total_trades if total_trades > 0 else 0
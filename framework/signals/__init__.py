@@ -12,8 +12,9 @@ import polars as pl
 import numpy as np
 from enum import Enum
 from typing import Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from framework._njit import njit
 from framework.risk_reward import (
     adjust_forward_returns_for_rr_exit_fills,
     long_trade_bar_rr_exit_fill,
@@ -54,68 +55,242 @@ class SignalChange(Enum):
     @property
     def is_entry(self) -> bool:
         """Check if this is an entry signal"""
-        return "TO_LONG" in self.value or "TO_SHORT" in self.value
+        return self in _ENTRY_CHANGES
     
     @property
     def is_exit(self) -> bool:
         """Check if this is an exit signal"""
-        return "TO_NEUTRAL" in self.value
+        return self in _EXIT_CHANGES
     
     @property
     def is_long_signal(self) -> bool:
         """Check if this involves a long position"""
-        return "LONG" in self.value
+        return self in _LONG_CHANGES
     
     @property
     def is_short_signal(self) -> bool:
         """Check if this involves a short position"""
-        return "SHORT" in self.value
+        return self in _SHORT_CHANGES
     
     @property
     def plot_color(self) -> str:
         """Get the color for plotting this signal"""
-        if self.is_entry and self.is_long_signal:
-            return 'green'
-        elif self.is_entry and self.is_short_signal:
-            return 'red'
-        elif self.is_exit:
-            return 'orange'
-        else:
-            return 'blue'
+        return _PLOT_COLOR[self]
     
     @property
     def plot_marker(self) -> str:
         """Get the marker for plotting this signal"""
-        if self.is_entry and self.is_long_signal:
-            return '^'
-        elif self.is_entry and self.is_short_signal:
-            return 'v'
-        elif self.is_exit:
-            return 'x'
+        return _PLOT_MARKER[self]
+    
+    @property
+    def code(self) -> int:
+        """int8 code of this change; integer raw signals declared as SignalChange hold these"""
+        return _SIGNAL_CHANGE_CODE[self]
+
+
+# Property tables for SignalChange, built once instead of scanning the value strings
+_ENTRY_CHANGES = frozenset({
+    SignalChange.NEUTRAL_TO_LONG,
+    SignalChange.NEUTRAL_TO_SHORT,
+    SignalChange.LONG_TO_SHORT,
+    SignalChange.SHORT_TO_LONG,
+})
+_EXIT_CHANGES = frozenset({SignalChange.LONG_TO_NEUTRAL, SignalChange.SHORT_TO_NEUTRAL})
+_LONG_CHANGES = frozenset({
+    SignalChange.NEUTRAL_TO_LONG,
+    SignalChange.LONG_TO_NEUTRAL,
+    SignalChange.LONG_TO_SHORT,
+    SignalChange.SHORT_TO_LONG,
+})
+_SHORT_CHANGES = frozenset({
+    SignalChange.NEUTRAL_TO_SHORT,
+    SignalChange.SHORT_TO_NEUTRAL,
+    SignalChange.LONG_TO_SHORT,
+    SignalChange.SHORT_TO_LONG,
+})
+# Entries are colored by the side being entered (a LONG_TO_SHORT flip is a short entry)
+_PLOT_COLOR = {
+    SignalChange.NEUTRAL_TO_LONG: 'green',
+    SignalChange.SHORT_TO_LONG: 'green',
+    SignalChange.NEUTRAL_TO_SHORT: 'red',
+    SignalChange.LONG_TO_SHORT: 'red',
+    SignalChange.LONG_TO_NEUTRAL: 'orange',
+    SignalChange.SHORT_TO_NEUTRAL: 'orange',
+    SignalChange.NO_CHANGE: 'blue',
+}
+_PLOT_MARKER = {
+    SignalChange.NEUTRAL_TO_LONG: '^',
+    SignalChange.SHORT_TO_LONG: '^',
+    SignalChange.NEUTRAL_TO_SHORT: 'v',
+    SignalChange.LONG_TO_SHORT: 'v',
+    SignalChange.LONG_TO_NEUTRAL: 'x',
+    SignalChange.SHORT_TO_NEUTRAL: 'x',
+    SignalChange.NO_CHANGE: 'o',
+}
+
+
+# ---------------------------------------------------------------------------
+# int8 encoding used by the SignalManager state machine
+# ---------------------------------------------------------------------------
+# Change codes index _SIGNAL_CHANGE_BY_CODE; positions are stored as -1 / 0 / 1
+# and index tables as ``position + 1``.
+_SIGNAL_CHANGE_BY_CODE = (
+    SignalChange.NO_CHANGE,
+    SignalChange.NEUTRAL_TO_LONG,
+    SignalChange.NEUTRAL_TO_SHORT,
+    SignalChange.LONG_TO_NEUTRAL,
+    SignalChange.LONG_TO_SHORT,
+    SignalChange.SHORT_TO_NEUTRAL,
+    SignalChange.SHORT_TO_LONG,
+)
+_SIGNAL_CHANGE_CODE = {change: code for code, change in enumerate(_SIGNAL_CHANGE_BY_CODE)}
+_SIGNAL_CHANGE_VALUES = np.array([change.value for change in _SIGNAL_CHANGE_BY_CODE])
+_SIGNAL_CHANGE_CODE_BY_VALUE = {change.value: code for change, code in _SIGNAL_CHANGE_CODE.items()}
+# Categories in code order, so an Enum column's physical values are the change codes
+SIGNAL_CHANGE_DTYPE = pl.Enum(_SIGNAL_CHANGE_VALUES.tolist())
+# Object array (not a list) so polars keeps the enum members in Object columns
+_SIGNAL_CHANGE_OBJECTS = np.empty(len(_SIGNAL_CHANGE_BY_CODE), dtype=object)
+_SIGNAL_CHANGE_OBJECTS[:] = _SIGNAL_CHANGE_BY_CODE
+_PLOT_COLOR_BY_VALUE = {change.value: color for change, color in _PLOT_COLOR.items()}
+_PLOT_MARKER_BY_VALUE = {change.value: marker for change, marker in _PLOT_MARKER.items()}
+NO_CHANGE_CODE = _SIGNAL_CHANGE_CODE[SignalChange.NO_CHANGE]
+LONG_TO_NEUTRAL_CODE = _SIGNAL_CHANGE_CODE[SignalChange.LONG_TO_NEUTRAL]
+SHORT_TO_NEUTRAL_CODE = _SIGNAL_CHANGE_CODE[SignalChange.SHORT_TO_NEUTRAL]
+
+
+def _integer_signal_type(raw_signals: pl.Series) -> type:
+    """Signal type of integer raw signals: PositionState values (-1 / 0 / 1) or change codes
+
+    polars stores a list of PositionState members as their integer values, so a series
+    that stays within -1..1 reads as positions. Any other value can only be a
+    ``SignalChange.code``. Codes limited to 0 / 1 (NO_CHANGE / NEUTRAL_TO_LONG) look
+    exactly like positions; strategies emitting codes should declare ``SIGNAL_TYPE``.
+    """
+    low, high = raw_signals.min(), raw_signals.max()
+    if low is None or (low >= -1 and high <= 1):
+        return PositionState
+    return SignalChange
+
+
+# _TRANSITION[current + 1, change_code] -> (new position, emitted change code)
+_TRANSITION = np.empty((3, len(_SIGNAL_CHANGE_BY_CODE), 2), dtype=np.int8)
+_TRANSITION[:, :, 0] = [
+    # NO_CHANGE, N->L, N->S, L->N, L->S, S->N, S->L
+    [-1, 1, -1, 0, -1, 0, 1],  # from SHORT
+    [0, 1, -1, 0, -1, 0, 1],   # from NEUTRAL
+    [1, 1, -1, 0, -1, 0, 1],   # from LONG
+]
+_TRANSITION[:, :, 1] = np.arange(len(_SIGNAL_CHANGE_BY_CODE), dtype=np.int8)
+
+# _STATE_TO_CHANGE[current + 1, target_state + 1] -> change code (PositionState inputs)
+_STATE_TO_CHANGE = np.array(
+    [
+        # to SHORT, to NEUTRAL, to LONG
+        [NO_CHANGE_CODE, SHORT_TO_NEUTRAL_CODE, _SIGNAL_CHANGE_CODE[SignalChange.SHORT_TO_LONG]],
+        [_SIGNAL_CHANGE_CODE[SignalChange.NEUTRAL_TO_SHORT], NO_CHANGE_CODE, _SIGNAL_CHANGE_CODE[SignalChange.NEUTRAL_TO_LONG]],
+        [_SIGNAL_CHANGE_CODE[SignalChange.LONG_TO_SHORT], LONG_TO_NEUTRAL_CODE, NO_CHANGE_CODE],
+    ],
+    dtype=np.int8,
+)
+
+# _EXIT_FROM_STATE[current + 1] -> change code emitted when an exit condition fires
+_EXIT_FROM_STATE = np.array(
+    [SHORT_TO_NEUTRAL_CODE, NO_CHANGE_CODE, LONG_TO_NEUTRAL_CODE], dtype=np.int8
+)
+
+
+@njit(cache=True)
+def _run_state_machine(codes, exits, position_states, transition, state_to_change, exit_from_state):
+    """Bar-by-bar position state machine over int8 arrays.
+
+    ``codes`` holds change codes, or target positions (-1 / 0 / 1) when
+    ``position_states`` is true. Returns ``(positions, change_codes)``.
+    """
+    n = codes.shape[0]
+    positions = np.empty(n, dtype=np.int8)
+    changes = np.empty(n, dtype=np.int8)
+    current = 0
+    for i in range(n):
+        if position_states:
+            code = state_to_change[current + 1, codes[i] + 1]
         else:
-            return 'o'
+            code = codes[i]
+
+        # Exit conditions win over the raw signal while in a position
+        if exits[i] and current != 0:
+            code = exit_from_state[current + 1]
+
+        # Scalar loads (not a row view) keep the loop free of array temporaries
+        changes[i] = transition[current + 1, code, 1]
+        current = transition[current + 1, code, 0]
+        positions[i] = current
+    return positions, changes
+
+
+def _signal_change_strings(changes: pl.Series) -> pl.Series:
+    """String view of signal changes stored as SignalChange objects, enums or strings"""
+    if changes.dtype == pl.Object:
+        return pl.Series([str(c) for c in changes.to_list()], dtype=pl.String)
+    return changes.cast(pl.String)
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalResult:
     """Result from signal generation containing position states and changes"""
-    position_signals: pl.Series  # Position states (1, -1, 0) for return calculation
+    position_signals: pl.Series  # Position states (1, -1, 0; Int8 from SignalManager) for return calculation
     signal_changes: pl.Series    # Signal changes for plotting and analysis
     raw_signals: Optional[pl.Series] = None  # Optional raw signals before position management
+    # Bar indices where a real change (not null / NO_CHANGE) was emitted; filled by SignalManager
+    change_positions: Optional[np.ndarray] = field(default=None, repr=False)
+    # int8 SignalChange.code per bar; filled by SignalManager, whose signal_changes is an Enum view of it
+    change_codes: Optional[np.ndarray] = field(default=None, repr=False)
+    # (data, stop_loss, take_profit, frame) from the last get_signal_changes_for_plotting call
+    _plot_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def _get_change_positions(self) -> np.ndarray:
+        """Bar indices of real signal changes (computed once if not supplied by the FSM)"""
+        if self.change_positions is None:
+            self.change_positions = np.fromiter(
+                (
+                    i for i, c in enumerate(self.signal_changes.to_list())
+                    if c is not None and str(c) != SignalChange.NO_CHANGE.value
+                ),
+                dtype=np.int64,
+            )
+        return self.change_positions
+    
+    @property
+    def position_array(self) -> np.ndarray:
+        """Position states as a NumPy array (a zero-copy view of the Int8 series from SignalManager)"""
+        return self.position_signals.to_numpy()
     
     def get_position_counts(self) -> Dict[str, int]:
         """Get count of each position state"""
-        counts = {}
-        for state in PositionState:
-            counts[state.name] = (self.position_signals == state.value).sum()
-        return counts
+        # One bincount pass over -1 / 0 / 1 shifted to 0 / 1 / 2
+        values = self.position_signals.drop_nulls().to_numpy()
+        values = values[np.isin(values, (-1, 0, 1))]
+        bins = np.bincount((values + 1).astype(np.intp), minlength=3)
+        return {state.name: int(bins[state.value + 1]) for state in PositionState}
     
     def get_signal_change_counts(self) -> Dict[str, int]:
         """Get count of each signal change type"""
-        valid_changes = self.signal_changes.drop_nulls()
+        if self.change_codes is not None:
+            bins = np.bincount(self.change_codes.astype(np.intp), minlength=len(_SIGNAL_CHANGE_BY_CODE))
+            return {
+                change.value: int(bins[_SIGNAL_CHANGE_CODE[change]])
+                for change in SignalChange
+                if bins[_SIGNAL_CHANGE_CODE[change]] > 0
+            }
+        positions = self._get_change_positions()
+        changes = _signal_change_strings(self.signal_changes.gather(positions))
+        found = dict(changes.value_counts().iter_rows())
         counts = {}
         for change in SignalChange:
-            count = (valid_changes == change.value).sum()
+            if change == SignalChange.NO_CHANGE:
+                # Everything non-null that is not a real change
+                count = len(self.signal_changes) - self.signal_changes.null_count() - len(positions)
+            else:
+                count = found.get(change.value, 0)
             if count > 0:
                 counts[change.value] = count
         return counts
@@ -137,13 +312,62 @@ class SignalResult:
         Exit markers (``LONG_TO_NEUTRAL`` / ``SHORT_TO_NEUTRAL``) use the RR intrabar
         fill price when ``high``, ``low``, and aligned stop/tp series are supplied;
         otherwise the bar **close** is used (legacy behavior).
+
+        The frame is cached for the same ``data`` / ``stop_loss`` / ``take_profit``
+        objects, so several plots of one result build it only once.
         """
-        # Index i must align with ``data`` rows — do not iterate ``drop_nulls()`` only or
-        # timestamps/prices land on the wrong bars when nulls are present.
-        changes = self.signal_changes.to_list()
-        if len(changes) == 0:
+        cache = self._plot_cache
+        if cache is not None and cache[0] is data and cache[1] is stop_loss and cache[2] is take_profit:
+            return cache[3]
+        frame = self._build_plot_frame(data, stop_loss, take_profit)
+        self._plot_cache = (data, stop_loss, take_profit, frame)
+        return frame
+
+    def _build_plot_frame(
+        self,
+        data: Optional[pl.DataFrame],
+        stop_loss: Optional[pl.Series],
+        take_profit: Optional[pl.Series],
+    ) -> pl.DataFrame:
+        """Uncached body of ``get_signal_changes_for_plotting``"""
+        # Index i must align with ``data`` rows — use the tracked change positions
+        # (not ``drop_nulls()``) or timestamps/prices land on the wrong bars.
+        positions = self._get_change_positions()
+        if len(positions) == 0:
+            return pl.DataFrame()
+        changes = _signal_change_strings(self.signal_changes.gather(positions))
+        frame = pl.DataFrame(
+            {"index": positions.astype(np.int64), "signal_change": changes}
+        ).filter(pl.col("signal_change").is_in(_SIGNAL_CHANGE_VALUES.tolist()))
+        if frame.height == 0:
             return pl.DataFrame()
 
+        index = frame["index"].to_numpy()
+        if data is not None and "timestamp" in data.columns:
+            in_range = index < len(data)
+            take = np.where(in_range, index, 0)
+            frame = frame.with_columns(
+                data["timestamp"].gather(take).alias("timestamp"),
+                data["close"].cast(pl.Float64).gather(take).alias("price"),
+            )
+            if not in_range.all():
+                # Rows past the end of ``data`` fall back to (index, 0.0) as without data.
+                # A temporal timestamp column cannot hold the bare index, so those rows
+                # get a null timestamp rather than turning the whole column into integers.
+                timestamp_dtype = frame["timestamp"].dtype
+                fallback_timestamp = (
+                    pl.col("index").cast(timestamp_dtype) if timestamp_dtype.is_numeric() else None
+                )
+                in_range_mask = pl.Series(in_range)
+                frame = frame.with_columns(
+                    pl.when(in_range_mask).then(pl.col("timestamp")).otherwise(fallback_timestamp),
+                    pl.when(in_range_mask).then(pl.col("price")).otherwise(0.0),
+                )
+        else:
+            frame = frame.with_columns(
+                pl.col("index").alias("timestamp"), pl.lit(0.0).alias("price")
+            )
+
         use_rr_exit_price = (
             data is not None
             and stop_loss is not None
@@ -153,60 +377,52 @@ class SignalResult:
             and "close" in data.columns
             and len(data) == len(stop_loss) == len(take_profit)
         )
-
-        plot_data = []
-        for i, change_str in enumerate(changes):
-            if change_str is None:
-                continue
-            cs = change_str.value if isinstance(change_str, SignalChange) else str(change_str)
-            if cs == "NO_CHANGE":
-                continue
-
-            try:
-                change_enum = (
-                    change_str if isinstance(change_str, SignalChange) else SignalChange(cs)
-                )
-                if data is not None and "timestamp" in data.columns and i < len(data):
-                    actual_timestamp = data["timestamp"][i]
-                    actual_price = float(data["close"][i])
-                else:
-                    actual_timestamp = i
-                    actual_price = 0.0
-
-                if use_rr_exit_price and i > 0 and change_enum in (
-                    SignalChange.LONG_TO_NEUTRAL,
-                    SignalChange.SHORT_TO_NEUTRAL,
-                ):
-                    lh = i - 1
-                    sl = float(stop_loss[lh])
-                    tp = float(take_profit[lh])
+        if use_rr_exit_price:
+            # Only exit rows need the intrabar fill; everything else keeps the close
+            exit_rows = np.flatnonzero(
+                frame["signal_change"]
+                .is_in([SignalChange.LONG_TO_NEUTRAL.value, SignalChange.SHORT_TO_NEUTRAL.value])
+                .to_numpy()
+                & (index > 0)
+                & (index < len(data))
+            )
+            if len(exit_rows):
+                price = frame["price"].to_numpy().copy()
+                exit_changes = frame["signal_change"].to_list()
+                for row in exit_rows.tolist():
+                    i = int(index[row])
+                    sl = float(stop_loss[i - 1])
+                    tp = float(take_profit[i - 1])
                     lo = float(data["low"][i])
                     hi = float(data["high"][i])
-                    if change_enum == SignalChange.LONG_TO_NEUTRAL:
+                    if exit_changes[row] == SignalChange.LONG_TO_NEUTRAL.value:
                         fill = long_trade_bar_rr_exit_fill(lo, hi, sl, tp)
                     else:
                         fill = short_trade_bar_rr_exit_fill(lo, hi, sl, tp)
                     if fill is not None:
-                        actual_price = float(fill)
-
-                plot_data.append(
-                    {
-                        "index": i,
-                        "timestamp": actual_timestamp,
-                        "price": actual_price,
-                        "signal_change": change_enum,
-                        "color": change_enum.plot_color,
-                        "marker": change_enum.plot_marker,
-                    }
-                )
-            except ValueError:
-                continue
-
-        return pl.DataFrame(plot_data)
+                        price[row] = float(fill)
+                frame = frame.with_columns(pl.Series("price", price))
+
+        return frame.select(
+            "index",
+            "timestamp",
+            "price",
+            pl.Series(
+                "signal_change",
+                _SIGNAL_CHANGE_OBJECTS[
+                    frame["signal_change"].replace_strict(_SIGNAL_CHANGE_CODE_BY_VALUE).to_numpy()
+                ],
+                dtype=pl.Object,
+            ),
+            pl.col("signal_change").replace_strict(_PLOT_COLOR_BY_VALUE).alias("color"),
+            pl.col("signal_change").replace_strict(_PLOT_MARKER_BY_VALUE).alias("marker"),
+        )
 
 
 class SignalManager:
     """Manages signal generation and position state transitions"""
+
+    __slots__ = ('current_position',)
     
     def __init__(self):
         self.current_position = PositionState.NEUTRAL
@@ -223,93 +439,89 @@ class SignalManager:
             SignalResult: Contains position signals and signal changes
         """
         
-        # Convert to lists for easier manipulation
-        raw_signals_list = raw_signals.to_list()
-        exit_conditions_list = exit_conditions.to_list() if exit_conditions is not None else [False] * len(raw_signals)
-        
         # Auto-detect signal type if not provided
-        if signal_type is None and len(raw_signals_list) > 0:
-            if isinstance(raw_signals_list[0], SignalChange):
+        if signal_type is None and len(raw_signals) > 0:
+            first = raw_signals.first()
+            if raw_signals.dtype.is_integer():
+                signal_type = _integer_signal_type(raw_signals)
+            elif isinstance(first, (SignalChange, str)):
                 signal_type = SignalChange
-            elif isinstance(raw_signals_list[0], PositionState):
+            elif isinstance(first, PositionState):
                 signal_type = PositionState
-            elif isinstance(raw_signals_list[0], str):
-                # Convert strings back to SignalChange enums
-                signal_type = SignalChange
-                raw_signals_list = [self._string_to_signal_change(s) for s in raw_signals_list]
             else:
-                raise ValueError(f"Unknown signal type: {type(raw_signals_list[0])}")
-        
-        position_signals_list = []
-        signal_changes_list = []
-        
-        self.current_position = PositionState.NEUTRAL
-        
-        for i in range(len(raw_signals_list)):
-            raw_signal = raw_signals_list[i]
-            exit_condition = exit_conditions_list[i]
-            
-            # Convert PositionState to SignalChange if needed
-            if signal_type == PositionState:
-                # raw_signal is a string representation of PositionState
-                position_state = PositionState(raw_signal)
-                signal_change = self._position_state_to_signal_change(position_state)
-            else:
-                signal_change = raw_signal
-            
-            # Handle exit conditions first
-            if exit_condition and self.current_position != PositionState.NEUTRAL:
-                if self.current_position == PositionState.LONG:
-                    signal_change = SignalChange.LONG_TO_NEUTRAL
-                elif self.current_position == PositionState.SHORT:
-                    signal_change = SignalChange.SHORT_TO_NEUTRAL
-            
-            # Apply signal change to determine new position
-            new_position = self._apply_signal_change(signal_change)
-            
-            # Update position
-            self.current_position = new_position
-            position_signals_list.append(self.current_position.value)
-            signal_changes_list.append(signal_change.value if hasattr(signal_change, 'value') else str(signal_change))
-        
-        # Convert back to polars Series
-        position_signals = pl.Series(position_signals_list)
-        signal_changes = pl.Series(signal_changes_list)
-        
+                raise ValueError(f"Unknown signal type: {type(first)}")
+
+        # Encode signals as int8 codes so the per-bar loop runs over plain arrays
+        position_states = signal_type == PositionState
+        codes = self._encode_signals(raw_signals, position_states)
+
+        if exit_conditions is not None:
+            exits = exit_conditions.cast(pl.Boolean).fill_null(False).to_numpy().astype(np.bool_)
+        else:
+            exits = np.zeros(len(raw_signals), dtype=np.bool_)
+
+        positions, change_codes = _run_state_machine(
+            codes, exits, position_states, _TRANSITION, _STATE_TO_CHANGE, _EXIT_FROM_STATE
+        )
+        self.current_position = PositionState(int(positions[-1])) if len(positions) else PositionState.NEUTRAL
+
         return SignalResult(
-            position_signals=position_signals,
-            signal_changes=signal_changes,
-            raw_signals=raw_signals
+            position_signals=pl.Series("position_signals", positions),
+            signal_changes=pl.Series(_SIGNAL_CHANGE_VALUES[change_codes], dtype=SIGNAL_CHANGE_DTYPE),
+            raw_signals=raw_signals,
+            change_positions=np.flatnonzero(change_codes != NO_CHANGE_CODE),
+            change_codes=change_codes,
+        )
+
+    @classmethod
+    def _encode_signals(cls, raw_signals: pl.Series, position_states: bool) -> np.ndarray:
+        """Encode raw signals as int8 change codes (or -1 / 0 / 1 targets for PositionState)
+
+        String, Enum and numeric columns are encoded from their native buffers; only
+        Object columns holding enum members are walked element by element. Integer
+        columns given as SignalChange are taken as ``SignalChange.code`` values.
+        """
+        if raw_signals.dtype == pl.Object:
+            if position_states:
+                values = (PositionState(s).value for s in raw_signals.to_numpy())
+            else:
+                values = (cls._signal_change_code(s) for s in raw_signals.to_numpy())
+            return np.fromiter(values, dtype=np.int8, count=len(raw_signals))
+
+        if position_states:
+            targets = raw_signals.to_numpy()
+            if not np.isin(targets, (-1, 0, 1)).all():
+                raise ValueError("PositionState signals must be -1, 0 or 1")
+            return targets.astype(np.int8, copy=False)
+
+        if raw_signals.dtype.is_integer():
+            # Already change codes (SignalChange.code), e.g. an int8 buffer from a kernel
+            codes = raw_signals.fill_null(NO_CHANGE_CODE).to_numpy()
+            if len(codes) and (codes.min() < 0 or codes.max() >= len(_SIGNAL_CHANGE_BY_CODE)):
+                raise ValueError("SignalChange codes must be SignalChange.code values")
+            return codes.astype(np.int8, copy=False)
+
+        return (
+            raw_signals.cast(pl.String)
+            .replace_strict(_SIGNAL_CHANGE_CODE_BY_VALUE, default=NO_CHANGE_CODE, return_dtype=pl.Int8)
+            .fill_null(NO_CHANGE_CODE)
+            .to_numpy()
         )
+
+    @staticmethod
+    def _signal_change_code(signal) -> int:
+        """Map a SignalChange (or its string value) to its int8 code; unknown -> NO_CHANGE"""
+        if isinstance(signal, SignalChange):
+            return _SIGNAL_CHANGE_CODE[signal]
+        try:
+            return _SIGNAL_CHANGE_CODE[SignalChange(str(signal))]
+        except ValueError:
+            return NO_CHANGE_CODE
     
     def _position_state_to_signal_change(self, position_state: PositionState) -> SignalChange:
         """Convert PositionState to SignalChange based on current position"""
-        
-        if position_state == PositionState.NEUTRAL:
-            if self.current_position == PositionState.LONG:
-                return SignalChange.LONG_TO_NEUTRAL
-            elif self.current_position == PositionState.SHORT:
-                return SignalChange.SHORT_TO_NEUTRAL
-            else:
-                return SignalChange.NO_CHANGE
-                
-        elif position_state == PositionState.LONG:
-            if self.current_position == PositionState.NEUTRAL:
-                return SignalChange.NEUTRAL_TO_LONG
-            elif self.current_position == PositionState.SHORT:
-                return SignalChange.SHORT_TO_LONG
-            else:
-                return SignalChange.NO_CHANGE
-                
-        elif position_state == PositionState.SHORT:
-            if self.current_position == PositionState.NEUTRAL:
-                return SignalChange.NEUTRAL_TO_SHORT
-            elif self.current_position == PositionState.LONG:
-                return SignalChange.LONG_TO_SHORT
-            else:
-                return SignalChange.NO_CHANGE
-        
-        return SignalChange.NO_CHANGE
+        code = _STATE_TO_CHANGE[self.current_position.value + 1, PositionState(position_state).value + 1]
+        return _SIGNAL_CHANGE_BY_CODE[code]
     
     def _string_to_signal_change(self, signal_str: str) -> SignalChange:
         """Convert string to SignalChange enum"""
@@ -321,32 +533,8 @@ class SignalManager:
     
     def _apply_signal_change(self, signal_change) -> PositionState:
         """Apply signal change to determine new position"""
-        
-        # Handle both string and enum inputs
-        if isinstance(signal_change, str):
-            signal_str = signal_change
-        elif isinstance(signal_change, SignalChange):
-            signal_str = signal_change.value
-        else:
-            # Try to convert to string
-            signal_str = str(signal_change)
-        
-        if signal_str == "NEUTRAL_TO_LONG":
-            return PositionState.LONG
-        elif signal_str == "NEUTRAL_TO_SHORT":
-            return PositionState.SHORT
-        elif signal_str == "LONG_TO_NEUTRAL":
-            return PositionState.NEUTRAL
-        elif signal_str == "SHORT_TO_NEUTRAL":
-            return PositionState.NEUTRAL
-        elif signal_str == "LONG_TO_SHORT":
-            return PositionState.SHORT
-        elif signal_str == "SHORT_TO_LONG":
-            return PositionState.LONG
-        elif signal_str == "NO_CHANGE":
-            return self.current_position
-        else:
-            return self.current_position
+        new_position = _TRANSITION[self.current_position.value + 1, self._signal_change_code(signal_change), 0]
+        return PositionState(int(new_position))
 
 
 def plot_signals(
@@ -383,26 +571,16 @@ def plot_signals(
     plot_data = signal_result.get_signal_changes_for_plotting(data, **plot_kw)
 
     if len(plot_data) > 0:
-        # Group by signal type for legend
-        signal_types = {}
-
-        for row in plot_data.iter_rows(named=True):
-            signal_type = row["signal_change"]
-            if signal_type not in signal_types:
-                signal_types[signal_type] = {
-                    "indices": [],
-                    "prices": [],
-                    "color": signal_type.plot_color,
-                    "marker": signal_type.plot_marker,
-                }
-
-            signal_types[signal_type]["indices"].append(row["index"])
-            signal_types[signal_type]["prices"].append(row["price"])
+        # One scatter per signal type (in order of first appearance, for the legend)
+        indices = plot_data["index"].to_numpy()
+        prices = plot_data["price"].to_numpy()
+        change_values = _signal_change_strings(plot_data["signal_change"])
         
-        # Plot each signal type
-        for signal_type, data_dict in signal_types.items():
-            ax.scatter(data_dict['indices'], data_dict['prices'], 
-                      color=data_dict['color'], marker=data_dict['marker'], 
+        for value in change_values.unique(maintain_order=True).to_list():
+            signal_type = SignalChange(value)
+            mask = (change_values == value).to_numpy()
+            ax.scatter(indices[mask], prices[mask], 
+                      color=signal_type.plot_color, marker=signal_type.plot_marker, 
                       s=100, alpha=0.9, label=str(signal_type), zorder=5)
     
     ax.set_title(title)
@@ -426,17 +604,24 @@ def plot_position_states(data: pl.DataFrame, signal_result: SignalResult,
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=(12, 4))
     
-    # Create position visualization
-    long_periods = signal_result.position_signals == PositionState.LONG.value
-    short_periods = signal_result.position_signals == PositionState.SHORT.value
-    neutral_periods = signal_result.position_signals == PositionState.NEUTRAL.value
+    # Split positions into runs of a single state and draw one bar per run
+    # instead of scanning the whole series once per state
+    pos = signal_result.position_signals.to_numpy()
+    breaks = np.flatnonzero(pos[1:] != pos[:-1]) + 1
+    starts = np.concatenate(([0], breaks)) if len(pos) else np.empty(0, dtype=np.intp)
+    ends = np.concatenate((breaks - 1, [len(pos) - 1])) if len(pos) else starts
     
-    ax.fill_between(range(len(data)), 0, 1, where=long_periods, 
-                    color='green', alpha=0.3, label='Long Position')
-    ax.fill_between(range(len(data)), -1, 0, where=short_periods, 
-                    color='red', alpha=0.3, label='Short Position')
-    ax.fill_between(range(len(data)), -0.5, 0.5, where=neutral_periods, 
-                    color='gray', alpha=0.3, label='Neutral Position')
+    for state, (y_low, y_high), color, label in (
+        (PositionState.LONG, (0, 1), 'green', 'Long Position'),
+        (PositionState.SHORT, (-1, 0), 'red', 'Short Position'),
+        (PositionState.NEUTRAL, (-0.5, 0.5), 'gray', 'Neutral Position'),
+    ):
+        in_state = pos[starts] == state.value
+        ax.broken_barh(
+            list(zip(starts[in_state], ends[in_state] - starts[in_state])),
+            (y_low, y_high - y_low),
+            facecolors=color, alpha=0.3, label=label,
+        )
     
     ax.set_title(title)
     ax.set_ylabel('Position')
@@ -451,6 +636,7 @@ def calculate_strategy_returns(
     *,
     stop_loss: Optional[pl.Series] = None,
     take_profit: Optional[pl.Series] = None,
+    forward_returns: Optional[pl.Series] = None,
 ) -> pl.Series:
     """Calculate strategy returns using position signals.
 
@@ -464,38 +650,61 @@ def calculate_strategy_returns(
         signal_result: SignalResult from signal generation
         stop_loss: Optional per-bar stop series (NaN when flat)
         take_profit: Optional per-bar take-profit series (NaN when flat)
+        forward_returns: Optional precomputed next-bar log returns for ``data``
+            (e.g. cached by the strategy across runs); derived from ``data`` when omitted
 
     Returns:
         pl.Series: Bar-aligned strategy returns (position × forward return)
     """
-    if "return" not in data.columns:
-        data = data.with_columns(
-            pl.col("close").log().diff().shift(-1).alias("return")
-        )
-
-    forward = np.asarray(data["return"].to_numpy(), dtype=np.float64)
-    # Last bar(s) have no next close → diff/shift leaves NaN; 0 * NaN would poison metrics.
-    forward = np.nan_to_num(forward, nan=0.0, posinf=0.0, neginf=0.0)
-    numeric_signals = np.asarray(
-        signal_result.position_signals.cast(pl.Float64).to_numpy(),
-        dtype=np.float64,
-    )
-
-    if (
+    use_rr_exit_fills = (
         stop_loss is not None
         and take_profit is not None
         and len(stop_loss) == len(data)
         and len(take_profit) == len(data)
         and all(c in data.columns for c in ("high", "low"))
-    ):
-        adjust_forward_returns_for_rr_exit_fills(
-            forward,
-            numeric_signals,
-            np.asarray(data["low"].to_numpy(), dtype=np.float64),
-            np.asarray(data["high"].to_numpy(), dtype=np.float64),
-            np.asarray(data["close"].to_numpy(), dtype=np.float64),
-            np.asarray(stop_loss.to_numpy(), dtype=np.float64),
-            np.asarray(take_profit.to_numpy(), dtype=np.float64),
+    )
+
+    if not use_rr_exit_fills:
+        # Forward return, NaN/inf cleanup and the position multiply as one lazy plan
+        # (projection pushdown only reads ``close`` / ``return``)
+        if forward_returns is not None:
+            forward = pl.lit(forward_returns).cast(pl.Float64)
+        elif "return" in data.columns:
+            forward = pl.col("return").cast(pl.Float64)
+        else:
+            forward = pl.col("close").cast(pl.Float64).log().diff().shift(-1)
+        # Last bar(s) have no next close → diff/shift leaves null; 0 * NaN would poison metrics.
+        forward = pl.when(forward.is_finite()).then(forward).otherwise(0.0)
+        return (
+            data.lazy()
+            .select((forward * pl.lit(signal_result.position_signals)).alias(""))
+            .collect()
+            .to_series()
         )
 
-    return pl.Series(numeric_signals * forward)
\ No newline at end of file
+    # RR exits rewrite single bars of the forward return in place, so stay in NumPy
+    # on a private copy (``data["return"]`` may be a zero-copy view of ``data``)
+    if forward_returns is not None:
+        forward = np.array(forward_returns.to_numpy(), dtype=np.float64)
+    elif "return" in data.columns:
+        forward = np.array(data["return"].to_numpy(), dtype=np.float64)
+    else:
+        close = np.asarray(data["close"].to_numpy(), dtype=np.float64)
+        forward = np.full(len(close), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            forward[:-1] = np.diff(np.log(close))
+    np.nan_to_num(forward, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    # Keep the native integer dtype; NumPy upcasts during the multiply below
+    numeric_signals = signal_result.position_array
+
+    adjust_forward_returns_for_rr_exit_fills(
+        forward,
+        numeric_signals,
+        np.asarray(data["low"].to_numpy(), dtype=np.float64),
+        np.asarray(data["high"].to_numpy(), dtype=np.float64),
+        np.asarray(data["close"].to_numpy(), dtype=np.float64),
+        np.asarray(stop_loss.to_numpy(), dtype=np.float64),
+        np.asarray(take_profit.to_numpy(), dtype=np.float64),
+    )
+
+    return pl.Series(numeric_signals * forward)
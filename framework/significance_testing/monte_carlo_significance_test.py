@@ -6,11 +6,50 @@ Tests whether strategy returns are significantly different from random
 by permuting the order of returns and comparing performance.
 """
 
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 import polars as pl
 import numpy as np
 from typing import Dict, Any, Optional
+from framework._njit import NUMBA_AVAILABLE, njit, prange
+from framework.performance.profit_factor_measure import _gross_profit_loss
 from .base_significance_test import BaseSignificanceTest
 
+# Upper bound on permuted values held in memory at once (~32 MB of float64)
+_MAX_BATCH_ELEMENTS = 4_000_000
+
+# Metrics that depend only on the multiset of returns, not their order
+_ORDER_INVARIANT_METRICS = ('sharpe', 'profit_factor', 'total_return')
+
+
+@njit(cache=True)
+def _max_drawdown(returns):
+    """Single pass max drawdown of compounded ``returns`` (peak starts at the first bar)"""
+    cumulative = 1.0
+    peak = -np.inf
+    max_drawdown = 0.0
+    for i in range(returns.shape[0]):
+        cumulative *= 1.0 + returns[i]
+        if cumulative > peak:
+            peak = cumulative
+        drawdown = (cumulative - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+    return max_drawdown
+
+
+@njit(cache=True, parallel=True)
+def _max_drawdown_rows(returns):
+    """``_max_drawdown`` for each row of a 2-D array (rows run in parallel under Numba)"""
+    out = np.empty(returns.shape[0], dtype=np.float64)
+    for row in prange(returns.shape[0]):
+        out[row] = _max_drawdown(returns[row])
+    return out
+
 
 class MonteCarloSignificanceTest(BaseSignificanceTest):
     """
@@ -26,24 +65,31 @@ class MonteCarloSignificanceTest(BaseSignificanceTest):
     This test helps answer: "Are these results due to skill or just luck?"
     """
     
-    def __init__(self, n_permutations: int = 1000, random_seed: Optional[int] = None):
+    def __init__(self, n_permutations: int = 1000, random_seed: Optional[int] = None,
+                 n_jobs: int = 1):
         """
         Initialize Monte Carlo Significance Test.
         
         Args:
             n_permutations: Number of random permutations to generate
             random_seed: Random seed for reproducibility
+            n_jobs: Worker processes for the permutation batches (1 = run
+                in-process, the default; -1 = all cores). Only used without Numba;
+                with Numba the drawdown kernel runs permutations on parallel threads
+                instead. Worth raising only for large tests: each spawned worker
+                re-imports the framework and receives a pickled copy of the returns,
+                and the calling script needs an ``if __name__ == "__main__"`` guard.
+                Results do not depend on this value.
         """
         super().__init__(
             name="Monte Carlo Significance Test",
             n_permutations=n_permutations,
-            random_seed=random_seed
+            random_seed=random_seed,
+            n_jobs=n_jobs
         )
         self.n_permutations = n_permutations
         self.random_seed = random_seed
-        
-        if random_seed is not None:
-            np.random.seed(random_seed)
+        self.n_jobs = n_jobs
     
     def test(self, data: pl.DataFrame, strategy_returns: pl.Series, **kwargs) -> Dict[str, Any]:
         """
@@ -53,7 +99,10 @@ class MonteCarloSignificanceTest(BaseSignificanceTest):
             data: Original market data (not used in this test)
             strategy_returns: Strategy returns to test
             **kwargs: Additional parameters
-                - metric: Performance metric to test ('sharpe', 'profit_factor', 'total_return')
+                - metric: Performance metric to test ('sharpe', 'profit_factor', 'total_return',
+                  'max_drawdown'). Only 'max_drawdown' depends on return order; the others
+                  tie under every permutation and short-circuit to a p-value of 1.0
+                  (flagged via ``degenerate_test``).
                 - confidence_level: Confidence level for significance (default 0.05)
         
         Returns:
@@ -62,36 +111,59 @@ class MonteCarloSignificanceTest(BaseSignificanceTest):
         metric = kwargs.get('metric', 'sharpe')
         confidence_level = kwargs.get('confidence_level', 0.05)
         
-        # Calculate the actual strategy performance metric
-        actual_metric = self._calculate_metric(strategy_returns, metric)
-        
-        # Generate random permutations and calculate their metrics
-        permuted_metrics = []
+        # Convert once; the actual metric and every permutation share this buffer
+        values = _returns_array(strategy_returns)
         
-        for _ in range(self.n_permutations):
-            # Create random permutation of returns
-            permuted_returns = strategy_returns.sample(fraction=1.0, seed=self.random_seed)
-            
-            # Calculate metric for this permutation
-            permuted_metric = self._calculate_metric(permuted_returns, metric)
-            permuted_metrics.append(permuted_metric)
-        
-        # Calculate p-value
-        permuted_metrics = np.array(permuted_metrics)
+        # Calculate the actual strategy performance metric
+        actual_metric = self._calculate_metric_np(values, metric)
         
-        if metric in ['sharpe', 'profit_factor', 'total_return']:
-            # For metrics where higher is better
-            p_value = np.mean(permuted_metrics >= actual_metric)
+        degenerate_test = metric in _ORDER_INVARIANT_METRICS
+        if degenerate_test:
+            # Shuffling cannot change a sum/mean/std, so every permutation ties the
+            # actual metric (permuted >= actual always holds); skip the loop
+            warnings.warn(
+                f"Metric '{metric}' is invariant to the order of returns, so a permutation "
+                "test cannot reject the null; use a path-dependent metric such as "
+                "'max_drawdown' instead.",
+                stacklevel=2,
+            )
+            p_value = 1.0
+            mean_random_metric = actual_metric
+            std_random_metric = 0.0
         else:
-            # For metrics where lower is better (like drawdown)
+            # Split permutations into memory-bounded batches, each with its own
+            # spawned seed so results are identical however batches are scheduled
+            batch_size = max(1, _MAX_BATCH_ELEMENTS // max(len(values), 1))
+            batch_sizes = [
+                min(batch_size, self.n_permutations - start)
+                for start in range(0, self.n_permutations, batch_size)
+            ]
+            seeds = np.random.SeedSequence(self.random_seed).spawn(len(batch_sizes))
+            
+            n_workers = self._resolve_n_workers(len(batch_sizes))
+            if n_workers > 1:
+                # spawn, not fork: polars' thread pool is not fork-safe
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as executor:
+                    batch_metrics = list(executor.map(
+                        _permuted_metrics, repeat(values), batch_sizes, seeds, repeat(metric)
+                    ))
+            else:
+                batch_metrics = [
+                    _permuted_metrics(values, size, seed, metric)
+                    for size, seed in zip(batch_sizes, seeds)
+                ]
+            permuted_metrics = np.concatenate(batch_metrics) if batch_metrics else np.empty(0)
+            
+            # Only path-dependent metrics reach here; lower is better (like drawdown)
             p_value = np.mean(permuted_metrics <= actual_metric)
+            
+            # Calculate additional statistics
+            mean_random_metric = np.mean(permuted_metrics)
+            std_random_metric = np.std(permuted_metrics)
         
         # Determine significance
         is_significant = p_value < confidence_level
-        
-        # Calculate additional statistics
-        mean_random_metric = np.mean(permuted_metrics)
-        std_random_metric = np.std(permuted_metrics)
         z_score = (actual_metric - mean_random_metric) / std_random_metric if std_random_metric > 0 else 0
         
         return {
@@ -104,7 +176,8 @@ class MonteCarloSignificanceTest(BaseSignificanceTest):
             'confidence_level': confidence_level,
             'n_permutations': self.n_permutations,
             'metric_tested': metric,
-            'test_name': self.name
+            'test_name': self.name,
+            'degenerate_test': degenerate_test
         }
     
     def _calculate_metric(self, returns: pl.Series, metric: str) -> float:
@@ -115,27 +188,83 @@ class MonteCarloSignificanceTest(BaseSignificanceTest):
             returns: Returns series
             metric: Metric to calculate
             
+        Returns:
+            Calculated metric value
+        """
+        return self._calculate_metric_np(_returns_array(returns), metric)
+    
+    @staticmethod
+    def _calculate_metric_np(returns: np.ndarray, metric: str) -> float:
+        """
+        Calculate the specified performance metric on a float64 array (nulls removed).
+        
+        Args:
+            returns: Returns array
+            metric: Metric to calculate
+            
         Returns:
             Calculated metric value
         """
         if metric == 'sharpe':
-            if returns.std() == 0:
-                return 0
-            return returns.mean() / returns.std() * np.sqrt(252)  # Annualized
+            std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+            if not std > 0:
+                return 0.0
+            return float(returns.mean() / std * np.sqrt(252))  # Annualized
         
         elif metric == 'profit_factor':
-            winning_trades = returns.filter(returns > 0).sum()
-            losing_trades = returns.filter(returns < 0).abs().sum()
-            return winning_trades / losing_trades if losing_trades > 0 else 0
+            winning_trades, losing_trades = _gross_profit_loss(returns)
+            return float(winning_trades / losing_trades) if losing_trades > 0 else 0.0
         
         elif metric == 'total_return':
-            return returns.sum()
+            return float(returns.sum())
         
         elif metric == 'max_drawdown':
-            cumulative = (1 + returns).cum_prod()
-            running_max = cumulative.cum_max()
-            drawdown = (cumulative - running_max) / running_max
-            return drawdown.min()
+            return float(_max_drawdown(returns))
+        
+        else:
+            raise ValueError(f"Unknown metric: {metric}")
+    
+    def _resolve_n_workers(self, n_batches: int) -> int:
+        """Number of worker processes to use for ``n_batches`` permutation batches"""
+        if NUMBA_AVAILABLE:
+            # The drawdown kernel already spreads rows across threads; extra
+            # processes would only add pickling and oversubscribe the cores
+            return 1
+        n_jobs = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        return max(1, min(n_jobs, n_batches))
+    
+    @staticmethod
+    def _calculate_metric_batch(returns: np.ndarray, metric: str) -> np.ndarray:
+        """
+        Calculate the specified performance metric for each row of a 2-D array.
+        
+        Mirrors ``_calculate_metric`` (sample std, annualized sharpe) so permuted
+        and actual metrics stay comparable.
+        
+        Args:
+            returns: Array of shape (n_permutations, n_returns)
+            metric: Metric to calculate
+            
+        Returns:
+            Array of metric values, one per row
+        """
+        if metric == 'sharpe':
+            mean = returns.mean(axis=1)
+            std = returns.std(axis=1, ddof=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(std > 0, mean / std * np.sqrt(252), 0.0)
+        
+        elif metric == 'profit_factor':
+            winning_trades = np.where(returns > 0, returns, 0.0).sum(axis=1)
+            losing_trades = np.where(returns < 0, -returns, 0.0).sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                return np.where(losing_trades > 0, winning_trades / losing_trades, 0.0)
+        
+        elif metric == 'total_return':
+            return returns.sum(axis=1)
+        
+        elif metric == 'max_drawdown':
+            return _max_drawdown_rows(np.ascontiguousarray(returns, dtype=np.float64))
         
         else:
             raise ValueError(f"Unknown metric: {metric}")
@@ -173,3 +302,16 @@ Interpretation: {'Strategy results are statistically significant and likely due
         """.strip()
         
         return summary
+
+
+def _returns_array(returns: pl.Series) -> np.ndarray:
+    """Contiguous float64 view of ``returns`` with nulls removed (polars reductions skip them)"""
+    return np.ascontiguousarray(returns.drop_nulls().cast(pl.Float64).to_numpy(), dtype=np.float64)
+
+
+def _permuted_metrics(values: np.ndarray, n_permutations: int,
+                      seed: np.random.SeedSequence, metric: str) -> np.ndarray:
+    """Score ``n_permutations`` shuffles of ``values`` (module-level so workers can pickle it)"""
+    rng = np.random.default_rng(seed)
+    permuted = rng.permuted(np.tile(values, (n_permutations, 1)), axis=1)
+    return MonteCarloSignificanceTest._calculate_metric_batch(permuted, metric)
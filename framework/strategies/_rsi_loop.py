@@ -0,0 +1,76 @@
+"""
+RSI breakout state machine
+==========================
+
+Bar-by-bar long-only RSI breakout positions over plain NumPy arrays, shared by
+the RSI research strategies so their signal loops run compiled (with Numba) instead
+of indexing polars Series one bar at a time. Without Numba the same positions are
+built with a vectorized forward fill.
+"""
+
+import numpy as np
+
+from framework._ffill import ffill_sparse_signal
+from framework._njit import NUMBA_AVAILABLE, njit
+
+
+def rsi_breakout_positions(rsi, oversold: float, overbought: float, position: int = 0) -> np.ndarray:
+    """Long-only RSI breakout positions (int8, 0 = flat, 1 = long) after each bar.
+
+    Uses the compiled state machine when Numba is installed, otherwise the
+    vectorized forward fill; both give identical results.
+    """
+    rsi = np.ascontiguousarray(rsi, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _rsi_state_machine(rsi, float(oversold), float(overbought), int(position))
+    return _rsi_positions_vectorized(rsi, float(oversold), float(overbought), int(position))
+
+
+def _rsi_positions_vectorized(rsi, oversold, overbought, position):
+    """Branchless equivalent of ``_rsi_state_machine``.
+
+    Entry crossings set the state to 1 and exit crossings to 0 (NaN comparisons are
+    false, so NaN bars never fire); everything else forward-fills the last state.
+    """
+    n = rsi.shape[0]
+    if n == 0:
+        return np.empty(0, dtype=np.int8)
+    previous_rsi, current_rsi = rsi[:-1], rsi[1:]
+    entries = (previous_rsi <= oversold) & (current_rsi > oversold)
+    exits = (previous_rsi >= overbought) & (current_rsi < overbought)
+    if np.any(entries & exits):
+        # Only possible when oversold >= overbought: the outcome then depends on the
+        # running position, which a forward fill cannot express
+        return _rsi_state_machine(rsi, oversold, overbought, position)
+
+    # Bar 0 never fires; entries set 1, exits set 0, other bars hold
+    no_event = np.zeros(1, dtype=np.bool_)
+    return ffill_sparse_signal(
+        np.concatenate((no_event, entries)), np.concatenate((no_event, exits)),
+        initial=position, short_value=0,
+    )
+
+
+@njit(cache=True, nogil=True)
+def _rsi_state_machine(rsi, oversold, overbought, position):
+    """Long-only RSI breakout positions (0 = flat, 1 = long) after each bar.
+
+    Enters when RSI crosses up through ``oversold`` while flat and exits when it
+    crosses down through ``overbought`` while long. Bars where the current or
+    previous RSI is NaN keep the position. ``position`` is the starting position.
+    """
+    n = rsi.shape[0]
+    out = np.empty(n, dtype=np.int8)
+    if n > 0:
+        out[0] = position
+    long = position == 1
+    for i in range(1, n):
+        current_rsi = rsi[i]
+        previous_rsi = rsi[i - 1]
+        # NaN comparisons are false, so NaN bars never fire; the update is plain
+        # boolean logic, leaving no data-dependent branch for RSI wiggling at a level
+        entry = (previous_rsi <= oversold) & (current_rsi > oversold)
+        exit_ = (previous_rsi >= overbought) & (current_rsi < overbought)
+        long = (long & (not exit_)) | ((not long) & entry)
+        out[i] = long
+    return out
@@ -31,14 +31,28 @@ class BaseStrategy(ABC):
         self.signals = None
         self.returns = None
         self.performance = {}
+        self._log_returns = None  # next-bar log returns of close, computed once
+        self._log_returns_source = None  # the DataFrame _log_returns was computed from
         
 
     def set_data_handler(self, data_handler):
         """Set the data handler"""
         self.data_handler = data_handler
         self.data = data_handler.get_data()
+        self._log_returns = None
         
 
+    def _get_log_returns(self) -> pl.Series:
+        """Next-bar log returns (a precomputed 'return' column wins), cached per data set"""
+        if 'return' in self.data.columns:
+            return self.data['return']
+        # Identity check also catches ``self.data`` being reassigned directly
+        if self._log_returns is None or self._log_returns_source is not self.data:
+            self._log_returns = self.data['close'].cast(pl.Float64).log().diff().shift(-1).alias('return')
+            self._log_returns_source = self.data
+        return self._log_returns
+    
+
     @abstractmethod
     def generate_signals(self, **kwargs) -> pl.Series:
         """Generate trading signals"""
@@ -47,7 +61,6 @@ class BaseStrategy(ABC):
 
     def calculate_performance(self) -> Dict[str, Any]:
         """Calculate performance measures"""
-        from framework.performance.returns_measure import ReturnsMeasure
         from framework.performance.profit_factor_measure import ProfitFactorMeasure
         from framework.performance.sharpe_ratio_measure import SharpeRatioMeasure
         from framework.performance.total_return_measure import TotalReturnMeasure
@@ -56,8 +69,8 @@ class BaseStrategy(ABC):
         from framework.performance.total_trades_measure import TotalTradesMeasure
         
         if self.returns is None:
-            returns_measure = ReturnsMeasure('signal')
-            self.returns = returns_measure.calculate(self.data)
+            # Same as ReturnsMeasure('signal'), without re-deriving log returns every run
+            self.returns = self.data['signal'] * self._get_log_returns()
             
         # Create measure instances
         profit_factor_measure = ProfitFactorMeasure()
@@ -111,7 +124,14 @@ class BaseStrategy(ABC):
         """Run the complete strategy pipeline"""
         # Generate signals
         self.signals = self.generate_signals(**kwargs)
+        if isinstance(self.signals, np.ndarray):
+            # Signal helpers may stay in NumPy; wrap once at the DataFrame boundary
+            self.signals = pl.Series('signal', self.signals)
+        previous_data = self.data
         self.data = self.data.with_columns(self.signals.alias('signal'))
+        if self._log_returns_source is previous_data:
+            # Only the signal column was added, so the cached log returns still apply
+            self._log_returns_source = self.data
         
         # Calculate performance
         performance = self.calculate_performance()
@@ -7,20 +7,31 @@ A base strategy class that uses the standardized signal system.
 
 import polars as pl
 import numpy as np
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, ClassVar
 from framework.strategies.base_strategy import BaseStrategy
 from framework.signals import (
     PositionState, SignalChange, SignalManager, SignalResult,
     plot_signals, plot_position_states, calculate_strategy_returns
 )
+from framework.signals import _integer_signal_type
+
+_SIGNAL_CHANGE_STRINGS = frozenset(e.value for e in SignalChange)
+_POSITION_STATE_STRINGS = frozenset(str(e.value) for e in PositionState)
 
 
 class SignalBasedStrategy(BaseStrategy):
     """Base strategy class that uses the standardized signal system"""
     
+    # Subclasses that always emit one kind of raw signal can set this to
+    # SignalChange or PositionState to skip auto-detection entirely
+    SIGNAL_TYPE: ClassVar[Optional[type]] = None
+    
     def __init__(self, name: str, data: pl.DataFrame):
         super().__init__(name, data)
         self.signal_manager = SignalManager()
+        self._signal_type: Optional[type] = type(self).SIGNAL_TYPE
+        # The base hook always returns None, so it is only called when overridden
+        self._has_exits = type(self).generate_exit_conditions is not SignalBasedStrategy.generate_exit_conditions
         
     def generate_signals(self, data: Optional[pl.DataFrame] = None, **kwargs) -> SignalResult:
         """Generate signals using the standardized signal system
@@ -39,32 +50,45 @@ class SignalBasedStrategy(BaseStrategy):
         if data is None:
             data = self.data
 
-        # Generate raw signals
+        # Generate raw signals (NumPy arrays are wrapped once here, zero-copy for numeric dtypes)
         raw_signals = self.generate_raw_signal(**kwargs)
+        if isinstance(raw_signals, np.ndarray):
+            raw_signals = pl.Series(raw_signals)
 
-        # Auto-detect signal type - check the actual values, not the types
-        if isinstance(raw_signals[0], SignalChange):
-            signal_type = SignalChange
-        elif isinstance(raw_signals[0], PositionState):
-            signal_type = PositionState
-        else:
-            # If it's a string, check if it matches SignalChange values
-            first_signal_str = str(raw_signals[0])
-            if first_signal_str in [e.value for e in SignalChange]:
-                signal_type = SignalChange
-            elif first_signal_str in [str(e.value) for e in PositionState]:
-                signal_type = PositionState
-            else:
-                signal_type = SignalChange  # Default to SignalChange
+        # Auto-detect the signal type once; a strategy's raw signals keep their kind
+        if self._signal_type is None and len(raw_signals) > 0:
+            self._signal_type = self._detect_signal_type(raw_signals)
+        signal_type = self._signal_type or SignalChange
         
         # Generate exit conditions (may depend on raw_signals, e.g. stop / RR)
-        exit_conditions = self.generate_exit_conditions(data, raw_signals=raw_signals, **kwargs)
+        exit_conditions = (
+            self.generate_exit_conditions(data, raw_signals=raw_signals, **kwargs) if self._has_exits else None
+        )
         
         # Use signal manager to generate position signals and changes
         signal_result = self.signal_manager.generate_signals(raw_signals, exit_conditions, signal_type)
         
         return signal_result
     
+    @staticmethod
+    def _detect_signal_type(raw_signals: pl.Series) -> type:
+        """Signal type from the first raw signal - check the actual values, not the types"""
+        if raw_signals.dtype.is_integer():
+            # The first value alone is ambiguous: code 0 (NO_CHANGE) is also PositionState.NEUTRAL
+            return _integer_signal_type(raw_signals)
+        first = raw_signals.first()
+        if isinstance(first, SignalChange):
+            return SignalChange
+        if isinstance(first, PositionState):
+            return PositionState
+        # If it's a string, check if it matches SignalChange values
+        first_signal_str = str(first)
+        if first_signal_str in _SIGNAL_CHANGE_STRINGS:
+            return SignalChange
+        if first_signal_str in _POSITION_STATE_STRINGS:
+            return PositionState
+        return SignalChange  # Default to SignalChange
+    
     def generate_raw_signal(self, **kwargs) -> pl.Series:
         """Generate raw trading signals using SignalChange enums
         
@@ -74,7 +98,9 @@ class SignalBasedStrategy(BaseStrategy):
             **kwargs: Strategy-specific parameters
             
         Returns:
-            pl.Series: SignalChange enums (NEUTRAL_TO_LONG, LONG_TO_NEUTRAL, etc.)
+            pl.Series: SignalChange enums (NEUTRAL_TO_LONG, LONG_TO_NEUTRAL, etc.), or a
+            NumPy array of PositionState values (-1 / 0 / 1) built without polars (int8
+            ``SignalChange.code`` values when ``SIGNAL_TYPE`` is SignalChange)
         """
         raise NotImplementedError("Subclasses must implement generate_raw_signal")
 
@@ -134,7 +160,13 @@ class SignalBasedStrategy(BaseStrategy):
     
     def _calculate_strategy_returns(self, data: pl.DataFrame, signal_result: SignalResult) -> pl.Series:
         """Calculate strategy returns from signal result"""
-        return calculate_strategy_returns(data, signal_result)
+        return calculate_strategy_returns(
+            data, signal_result, forward_returns=self._cached_forward_returns(data)
+        )
+
+    def _cached_forward_returns(self, data: pl.DataFrame) -> Optional[pl.Series]:
+        """Cached next-bar log returns when ``data`` is the strategy's own data, else None"""
+        return self._get_log_returns() if data is self.data else None
 
     
     def plot_strategy_signals(self, data: pl.DataFrame, signal_result: SignalResult, title: Optional[str] = None, ax=None) -> None:
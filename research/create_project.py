@@ -7,6 +7,8 @@ Creates a new research project directory with standardized structure.
 
 import os
 import sys
+from pathlib import Path
+from string import Template
 from datetime import datetime
 import argparse
 import textwrap
@@ -16,6 +18,39 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from research.version_manager import VersionManager
 
 
+# Subdirectories of every project; the ones listed in GITKEEP_DIRS get a
+# .gitkeep so they are tracked while still empty
+SUBDIRS = [
+    "data",           # Raw data and processed datasets
+    "results",        # Test results, performance metrics
+    "plots",          # Interactive graphs and visualizations
+    "notes",          # Research notes and observations
+    "strategies",     # Strategy implementations specific to this research
+    "tests",          # Test scripts and configurations
+    "archive"          # Archived results and old versions
+]
+GITKEEP_DIRS = ["data", "results", "plots", "notes", "archive"]
+
+# Project file templates (research/templates/*.tmpl), read once at import and
+# filled in with string.Template ($name placeholders)
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def _load_template(filename: str) -> Template:
+    return Template((TEMPLATES_DIR / filename).read_text().strip())
+
+
+GITKEEP_TEMPLATE = Template(
+    "# This file ensures the $directory directory is tracked by git\n"
+    "# even when it's empty. Remove this file if you want to ignore\n"
+    "# the entire directory.\n"
+)
+README_TEMPLATE = _load_template("README.md.tmpl")
+MAIN_TEMPLATE = _load_template("main.py.tmpl")
+STRATEGY_TEMPLATE = _load_template("strategy.py.tmpl")
+CONFIG_TEMPLATE = _load_template("config.py.tmpl")
+
+
 def create_research_project(project_name: str, description: str = "") -> str:
     """
     Create a new research project directory with standardized structure.
@@ -51,270 +86,30 @@ def create_research_project(project_name: str, description: str = "") -> str:
     project_dir = os.path.join("research", clean_name)
     os.makedirs(project_dir, exist_ok=True)
     
-    # Create subdirectories
-    subdirs = [
-        "data",           # Raw data and processed datasets
-        "results",        # Test results, performance metrics
-        "plots",          # Interactive graphs and visualizations
-        "notes",          # Research notes and observations
-        "strategies",     # Strategy implementations specific to this research
-        "tests",          # Test scripts and configurations
-        "archive"          # Archived results and old versions
-    ]
-    
-    for subdir in subdirs:
-        os.makedirs(os.path.join(project_dir, subdir), exist_ok=True)
-    
-    # Create .gitkeep files for empty directories that should be tracked
-    gitkeep_dirs = ["data", "results", "plots", "notes", "archive"]
-    for gitkeep_dir in gitkeep_dirs:
-        gitkeep_file = os.path.join(project_dir, gitkeep_dir, ".gitkeep")
-        with open(gitkeep_file, 'w') as f:
-            f.write(f"# This file ensures the {gitkeep_dir} directory is tracked by git\n")
-            f.write("# even when it's empty. Remove this file if you want to ignore\n")
-            f.write("# the entire directory.\n")
-    
-    # Create project README
-    readme_content = textwrap.dedent(f"""
-        # {project_name.title()}
-
-        **Created:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        **Description:** {description}
-
-        ## Project Structure
-
-        - `data/` - Raw data and processed datasets
-        - `results/` - Test results, performance metrics, and statistics
-        - `plots/` - Interactive graphs and visualizations
-        - `notes/` - Research notes, observations, and findings
-        - `strategies/` - Strategy implementations specific to this research
-        - `tests/` - Test scripts and configurations
-        - `archive/` - Archived results and old versions
-
-        ## Research Tests
-
-        ### 1. In-Sample Excellence Test
-        - **Purpose:** Proof of concept validation
-        - **Description:** Test strategy performance on historical data
-        - **Status:** [ ] Not Started / [ ] In Progress / [ ] Completed
-
-        ### 2. In-Sample Permutation Test
-        - **Purpose:** Statistical significance validation
-        - **Description:** Monte Carlo permutation test to validate results
-        - **Status:** [ ] Not Started / [ ] In Progress / [ ] Completed
-
-        ### 3. Walk Forward Test
-        - **Purpose:** Out-of-sample validation
-        - **Description:** Rolling window validation
-        - **Status:** [ ] Not Started / [ ] In Progress / [ ] Completed
-
-        ### 4. Walk Forward Permutation Test
-        - **Purpose:** Out-of-sample statistical validation
-        - **Description:** Monte Carlo permutation test on walk-forward results
-        - **Status:** [ ] Not Started / [ ] In Progress / [ ] Completed
-
-        ## Key Findings
-
-        *To be updated as research progresses...*
-
-        ## Next Steps
-
-        *To be updated as research progresses...*
-    """).strip()
-    
-    with open(os.path.join(project_dir, "README.md"), "w") as f:
-        f.write(readme_content)
-    
-    # Create main research script template
-    main_script_content = textwrap.dedent(f"""
-        \"\"\"
-        {project_name.title()} Research Script
-        ====================================
-
-        Main research script for {project_name}.
-        \"\"\"
-
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
-
-        import polars as pl
-        import numpy as np
-        import matplotlib.pyplot as plt
-        from datetime import datetime
-
-        # Framework imports
-        from framework import (
-            DataHandler, SignalBasedStrategy,
-            RSIFeature, DonchianFeature, PositionState, SignalChange
-        )
-        from framework.performance import (
-            ProfitFactorMeasure, SharpeRatioMeasure, SortinoRatioMeasure,
-            MaxDrawdownMeasure, TotalReturnMeasure, WinRateMeasure
-        )
-        from framework.significance_testing import MonteCarloSignificanceTest
-
-        # Import the standardized test
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-        from tests.insample_excellence_test import InSampleExcellenceTest
-
-        # Import project-specific strategy
-        from strategies.{clean_name}_strategy import {clean_name.title().replace("_", "")}Strategy
-
-
-        def run_insample_excellence_test():
-            \"\"\"Run in-sample excellence test (proof of concept)\"\"\"
-            print("=== {project_name.upper()} RESEARCH - IN-SAMPLE EXCELLENCE TEST ===")
-            print(f"Started: {{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}}")
-            
-            # Load data
-            data_handler = DataHandler('framework/data/BTCUSD1hour.pq')
-            data_handler.load_data()
-            data_handler.filter_date_range(2023, 2024)
-            data = data_handler.get_data()
-            
-            print(f"Data loaded: {{data.height}} rows from {{data['timestamp'][0]}} to {{data['timestamp'][-1]}}")
-            
-            # Create strategy
-            strategy = {clean_name.title().replace("_", "")}Strategy()
-            
-            # Initialize the standardized test with strategy
-            test = InSampleExcellenceTest(os.path.dirname(__file__), strategy)
-            
-            # Run the test
-            test_metadata = test.run_test(data_handler, "insample_excellence")
-            
-            # Create plots
-            signal_result = strategy.generate_signals()
-            test.create_performance_plots(data, signal_result, test_metadata['performance_results'])
-            
-            # Generate report
-            test.generate_test_report(test_metadata)
-            
-            print(f"\\n=== {project_name.upper()} RESEARCH COMPLETED ===")
-            print("Check the following directories for results:")
-            print("- results/ - Performance metrics and metadata")
-            print("- plots/ - Visualization charts")
-            print("- README.md - Project documentation")
-            
-            return test_metadata
-
-
-        def main():
-            \"\"\"Main research function\"\"\"
-            print("Starting {project_name} research...")
-            
-            # Run in-sample excellence test
-            results = run_insample_excellence_test()
-            
-            print(f"\\n{project_name} research completed!")
-            print("Check the results/ and plots/ directories for outputs.")
-
-
-        if __name__ == "__main__":
-            main()
-    """).strip()
-    
-    with open(os.path.join(project_dir, "main.py"), "w") as f:
-        f.write(main_script_content)
-    
-    # Create strategy file template
-    strategy_content = textwrap.dedent(f"""
-        \"\"\"
-        {clean_name.title().replace("_", "")}Strategy - {project_name.title()} Strategy
-        =======================================================
-
-        Strategy implementation for {project_name} research project.
-        \"\"\"
-
-        import polars as pl
-        import numpy as np
-        from framework import SignalBasedStrategy, SignalChange
-
-
-        class {clean_name.title().replace("_", "")}Strategy(SignalBasedStrategy):
-            \"\"\"Strategy implementation for {project_name} research\"\"\"
-            
-            def __init__(self, **kwargs):
-                super().__init__("{project_name.title()}")
-                # Initialize your strategy parameters here
-                pass
-            
-            def generate_raw_signals(self, data: pl.DataFrame, **kwargs) -> pl.Series:
-                \"\"\"Generate raw trading signals\"\"\"
-                # Implement your strategy logic here
-                signals = pl.Series([SignalChange.NO_CHANGE] * len(data))
-                return signals
-    """).strip()
-    
-    with open(os.path.join(project_dir, "strategies", f"{clean_name}_strategy.py"), "w") as f:
-        f.write(strategy_content)
-    
-    # Create test configuration file
-    test_config_content = textwrap.dedent(f"""
-        \"\"\"
-        Test Configuration for {project_name}
-        ===================================
-
-        Configuration settings for all research tests.
-        \"\"\"
-
-        # Data Configuration
-        DATA_CONFIG = {{
-            'data_file': 'framework/data/BTCUSD1hour.pq',
-            'start_year': 2023,
-            'end_year': 2024,
-            'insample_start': '2023-01-01',
-            'insample_end': '2023-06-30',
-            'outsample_start': '2023-07-01',
-            'outsample_end': '2023-12-31'
-        }}
-
-        # Strategy Configuration
-        STRATEGY_CONFIG = {{
-            'long_only': False,
-            'initial_capital': 10000,
-            'commission': 0.001,  # 0.1% commission
-            'slippage': 0.0005    # 0.05% slippage
-        }}
-
-        # Test Configuration
-        TEST_CONFIG = {{
-            'insample_excellence': {{
-                'enabled': True,
-                'description': 'Proof of concept validation'
-            }},
-            'insample_permutation': {{
-                'enabled': False,
-                'n_permutations': 1000,
-                'description': 'Statistical significance validation'
-            }},
-            'walk_forward': {{
-                'enabled': False,
-                'window_size': 252,  # 1 year
-                'step_size': 21,     # 1 month
-                'description': 'Out-of-sample validation'
-            }},
-            'walk_forward_permutation': {{
-                'enabled': False,
-                'n_permutations': 1000,
-                'description': 'Out-of-sample statistical validation'
-            }}
-        }}
-
-        # Performance Measures
-        PERFORMANCE_MEASURES = [
-            'profit_factor',
-            'sharpe_ratio', 
-            'sortino_ratio',
-            'max_drawdown',
-            'total_return',
-            'win_rate'
-        ]
-    """).strip()
-    
-    with open(os.path.join(project_dir, "tests", "config.py"), "w") as f:
-        f.write(test_config_content)
+    # Render every file first, then write them in one pass
+    context = {
+        'project_name': project_name,
+        'clean_name': clean_name,
+        'title': project_name.title(),
+        'upper': project_name.upper(),
+        'class_name': clean_name.title().replace("_", ""),
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'description': description,
+    }
+    files = {
+        f"{directory}/.gitkeep": GITKEEP_TEMPLATE.substitute(directory=directory)
+        for directory in GITKEEP_DIRS
+    }
+    files["README.md"] = README_TEMPLATE.substitute(context)
+    files["main.py"] = MAIN_TEMPLATE.substitute(context)
+    files[f"strategies/{clean_name}_strategy.py"] = STRATEGY_TEMPLATE.substitute(context)
+    files["tests/config.py"] = CONFIG_TEMPLATE.substitute(context)
+    
+    root = Path(project_dir)
+    for subdir in SUBDIRS:
+        (root / subdir).mkdir(parents=True, exist_ok=True)
+    for relpath, content in files.items():
+        (root / relpath).write_text(content)
     
     print(f"Research project '{project_name}' created successfully!")
     print(f"Project directory: {project_dir}")
@@ -5,13 +5,13 @@ Mach1_Rsi_Breakout Research Script
 Main research script for mach1_rsi_breakout.
 """
 
+import argparse
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import polars as pl
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 
 # Framework imports
@@ -33,15 +33,14 @@ from tests.insample_excellence_test import InSampleExcellenceTest
 from strategies.mach1_rsi_breakout_strategy import Mach1RsiBreakoutStrategy
 
 
-def run_insample_excellence_test():
+def run_insample_excellence_test(create_plots: bool = True):
     """Run in-sample excellence test (proof of concept)"""
     print("=== MACH1_RSI_BREAKOUT RESEARCH - IN-SAMPLE EXCELLENCE TEST ===")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Load data
     data_handler = DataHandler(os.path.join(os.path.dirname(__file__), '..', '..', 'framework', 'data', 'BTCUSD1hour.pq'))
-    data_handler.load_data()
-    data_handler.filter_date_range(2023, 2024)
+    data_handler.load_data(start_year=2023, end_year=2024)
     data = data_handler.get_data()
     
     print(f"Data loaded: {data.shape[0]} rows from {data['timestamp'][0]} to {data['timestamp'][-1]}")
@@ -55,9 +54,10 @@ def run_insample_excellence_test():
     # Run the test
     test_metadata = test.run_test(data_handler, "insample_excellence")
     
-    # Create plots
-    signal_result = strategy.generate_signals()
-    test.create_performance_plots(data, signal_result, test_metadata['performance_results'])
+    # Create plots (skipped with --no-plots)
+    if create_plots:
+        signal_result = strategy.generate_signals()
+        test.create_performance_plots(data, signal_result, test_metadata['performance_results'])
     
     # Generate report
     test.generate_test_report(test_metadata)
@@ -73,10 +73,13 @@ def run_insample_excellence_test():
 
 def main():
     """Main research function"""
+    parser = argparse.ArgumentParser(description='Run the in-sample excellence test')
+    parser.add_argument('--no-plots', action='store_true', help='Skip the interactive plots (faster sweeps)')
+    args = parser.parse_args()
     print("Starting mach1_rsi_breakout research...")
     
     # Run in-sample excellence test
-    results = run_insample_excellence_test()
+    results = run_insample_excellence_test(create_plots=not args.no_plots)
     
     print(f"\nmach1_rsi_breakout research completed!")
     print("Check the results/ and plots/ directories for outputs.")
@@ -9,11 +9,20 @@ and exits when RSI breaks below overbought levels.
 import polars as pl
 import numpy as np
 from framework import SignalBasedStrategy, RSIFeature, SignalChange
+from framework.strategies._rsi_loop import rsi_breakout_positions
+
+# Exit / hold / entry, indexed by position step + 1
+_STEP_CHANGE_CODES = np.array(
+    [SignalChange.LONG_TO_NEUTRAL.code, SignalChange.NO_CHANGE.code, SignalChange.NEUTRAL_TO_LONG.code],
+    dtype=np.int8,
+)
 
 
 class Mach1RsiBreakoutStrategy(SignalBasedStrategy):
     """RSI Breakout Strategy - Enter on oversold breakout, exit on overbought breakout"""
     
+    SIGNAL_TYPE = SignalChange
+    
     def __init__(self, data: pl.DataFrame, rsi_period=14, oversold=30, overbought=70, **kwargs):
         super().__init__("Mach1 RSI Breakout Strategy", data)
         # Create RSI feature with data at initialization
@@ -23,45 +32,31 @@ class Mach1RsiBreakoutStrategy(SignalBasedStrategy):
         self.overbought = overbought
         self.position = 0  # Track current position
     
-    def generate_raw_signal(self, **kwargs) -> pl.Series:
-        """Generate RSI breakout signals using SignalChange enums"""
+    def generate_raw_signal(self, **kwargs) -> np.ndarray:
+        """Generate RSI breakout signals as int8 ``SignalChange.code`` values"""
         
         # Override parameters if provided
         rsi_period = kwargs.get('rsi_period', self.rsi_period)
         oversold = kwargs.get('oversold', self.oversold)
         overbought = kwargs.get('overbought', self.overbought)
         
-        # Get RSI values from our stateful feature
-        rsi_values = self.rsi_feature.get_values()
-        
-        # Create signals for breakout strategy using SignalChange enums
-        signals_list = [SignalChange.NO_CHANGE] * len(self.data)
+        # Get RSI values from our stateful feature (nulls -> NaN for the compiled loop);
+        # it keeps one RSI per period, so threshold and period sweeps reuse them
+        self.rsi_feature.set_params(period=rsi_period)
+        rsi_values = np.ascontiguousarray(
+            self.rsi_feature.get_values().cast(pl.Float64).to_numpy(), dtype=np.float64
+        )
         
         # RSI Breakout Logic:
         # Enter long when RSI breaks above oversold level (coming out of oversold)
         # Exit long when RSI breaks below overbought level (coming out of overbought)
+        positions = rsi_breakout_positions(rsi_values, oversold, overbought, self.position)
+        if len(positions) > 0:
+            self.position = int(positions[-1])
         
-        for i in range(1, len(self.data)):
-            current_rsi = rsi_values[i]
-            previous_rsi = rsi_values[i-1]
-            
-            # Skip if RSI values are NaN
-            if current_rsi is None or previous_rsi is None or str(current_rsi) == 'nan' or str(previous_rsi) == 'nan':
-                continue
-            
-            # Enter long position: RSI was oversold and now breaks above oversold
-            if (previous_rsi <= oversold and current_rsi > oversold and self.position == 0):
-                signals_list[i] = SignalChange.NEUTRAL_TO_LONG
-                self.position = 1
-            
-            # Exit long position: RSI was overbought and now breaks below overbought
-            elif (previous_rsi >= overbought and current_rsi < overbought and self.position == 1):
-                signals_list[i] = SignalChange.LONG_TO_NEUTRAL
-                self.position = 0
-        
-        # Convert list to Polars Series
-        signals = pl.Series(signals_list)
-        return signals
+        # Position steps (-1 / 0 / +1) index straight into int8 SignalChange codes
+        steps = np.diff(positions, prepend=positions[:1])
+        return _STEP_CHANGE_CODES[steps + 1]
     
     def create_custom_plots(self, data: pl.DataFrame, signal_result, **kwargs) -> list:
         """Create custom plots using feature's built-in plot methods"""
@@ -8,11 +8,14 @@ Strategy implementation for mach2_rsi_testing research project.
 import polars as pl
 import numpy as np
 from framework import SignalBasedStrategy, PositionState, RSIFeature
+from framework.strategies._rsi_loop import rsi_breakout_positions
 
 
 class Mach2RsiTestingStrategy(SignalBasedStrategy):
     """Strategy implementation for mach2_rsi_testing research"""
     
+    SIGNAL_TYPE = PositionState
+    
     def __init__(self, **kwargs):
         super().__init__("Mach2_Rsi_Testing")
         # Initialize your strategy parameters here
@@ -22,37 +25,22 @@ class Mach2RsiTestingStrategy(SignalBasedStrategy):
         self.overbought = 70
         self.position = 0
     
-    def generate_raw_signal(self, data: pl.DataFrame, **kwargs) -> pl.Series:
+    def generate_raw_signal(self, data: pl.DataFrame, **kwargs) -> np.ndarray:
         """Generate raw trading signals using PositionState enums"""
         
-        rsi_values = self.rsi_feature.calculate(data)
+        rsi_values = np.ascontiguousarray(
+            self.rsi_feature.calculate(data).cast(pl.Float64).to_numpy(), dtype=np.float64
+        )
         
-        # Create signals list for easier manipulation
-        signals_list = [PositionState.NEUTRAL] * len(data)
+        # Enter long when RSI breaks above oversold, exit when it breaks below overbought
+        positions = rsi_breakout_positions(rsi_values, self.oversold, self.overbought, self.position)
+        if len(positions) > 0:
+            self.position = int(positions[-1])
         
-        for i in range(1, len(data)):
-            current_rsi = rsi_values[i]
-            previous_rsi = rsi_values[i-1]
-            
-            # Skip if RSI values are NaN
-            if current_rsi is None or previous_rsi is None or str(current_rsi) == 'nan' or str(previous_rsi) == 'nan':
-                continue
-            
-            # Enter long position: RSI was oversold and now breaks above oversold
-            if (previous_rsi <= self.oversold and current_rsi > self.oversold and self.position == 0):
-                signals_list[i] = PositionState.LONG
-                self.position = 1
-            # Exit long position: RSI was overbought and now breaks below overbought
-            elif (previous_rsi >= self.overbought and current_rsi < self.overbought and self.position == 1):
-                signals_list[i] = PositionState.NEUTRAL
-                self.position = 0
-            else:
-                # Maintain current position
-                if self.position == 1:
-                    signals_list[i] = PositionState.LONG
-                else:
-                    signals_list[i] = PositionState.NEUTRAL
+        # The first bar and bars with a NaN RSI (current or previous) report NEUTRAL
+        evaluated = np.zeros(len(rsi_values), dtype=np.bool_)
+        evaluated[1:] = ~np.isnan(rsi_values[1:]) & ~np.isnan(rsi_values[:-1])
+        states = np.where(evaluated, positions, PositionState.NEUTRAL.value)
         
-        # Convert list to Polars Series
-        signals = pl.Series(signals_list)
-        return signals
+        # PositionState values as int8; generate_signals wraps the array once
+        return states.astype(np.int8)
@@ -5,6 +5,7 @@ Mach3_Macd Research Script
 Main research script for mach3_macd.
 """
 
+import argparse
 import os
 import sys
 
@@ -24,7 +25,7 @@ from tests.insample_excellence_test import InSampleExcellenceTest
 from strategies.mach3_macd_strategy import Mach3MacdStrategy
 
 
-def run_insample_excellence_test():
+def run_insample_excellence_test(create_plots: bool = True):
     """Run in-sample excellence test (proof of concept)"""
     print("=== MACH3_MACD RESEARCH - IN-SAMPLE EXCELLENCE TEST ===")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -42,8 +43,7 @@ def run_insample_excellence_test():
         cache_dir=cache_dir,
     )
     data_handler = DataHandler(str(data_path), session_policy=session)
-    data_handler.load_data()
-    data_handler.filter_date_range(2024, 2026)
+    data_handler.load_data(start_year=2024, end_year=2026)
     data = data_handler.get_data()
 
     print(
@@ -56,8 +56,9 @@ def run_insample_excellence_test():
 
     test_metadata = test.run_test(data_handler, "insample_excellence")
 
-    signal_result = strategy.generate_signals()
-    test.create_performance_plots(data, signal_result, test_metadata["performance_results"])
+    if create_plots:
+        signal_result = strategy.generate_signals()
+        test.create_performance_plots(data, signal_result, test_metadata["performance_results"])
 
     test.generate_test_report(test_metadata)
 
@@ -72,9 +73,12 @@ def run_insample_excellence_test():
 
 def main():
     """Main research function"""
+    parser = argparse.ArgumentParser(description="Run the in-sample excellence test")
+    parser.add_argument("--no-plots", action="store_true", help="Skip the interactive plots (faster sweeps)")
+    args = parser.parse_args()
     print("Starting mach3_macd research...")
 
-    run_insample_excellence_test()
+    run_insample_excellence_test(create_plots=not args.no_plots)
 
     print("\nmach3_macd research completed!")
     print("Check the results/ and plots/ directories for outputs.")
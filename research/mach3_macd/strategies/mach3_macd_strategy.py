@@ -13,6 +13,8 @@ from framework import SignalBasedStrategy, SignalChange, MacdFeature
 class Mach3MacdStrategy(SignalBasedStrategy):
     """MACD / signal crossover — buy on bullish cross, flat on bearish cross."""
 
+    SIGNAL_TYPE = SignalChange
+
     def __init__(
         self,
         data: pl.DataFrame,
@@ -40,37 +42,38 @@ class Mach3MacdStrategy(SignalBasedStrategy):
         macd_line = self.macd_feature.get_macd_line()
         signal_line = self.macd_feature.get_signal()
 
-        n = len(self.data)
-        signals_list = [SignalChange.NO_CHANGE] * n
-
-        for i in range(1, n):
-            m_curr = macd_line[i]
-            m_prev = macd_line[i - 1]
-            s_curr = signal_line[i]
-            s_prev = signal_line[i - 1]
-
-            if any(
-                x is None or (isinstance(x, float) and str(x) == "nan")
-                for x in (m_curr, m_prev, s_curr, s_prev)
-            ):
-                continue
-
-            m_curr = float(m_curr)
-            m_prev = float(m_prev)
-            s_curr = float(s_curr)
-            s_prev = float(s_prev)
-
-            # Bullish crossover: MACD crosses above signal
-            if m_prev <= s_prev and m_curr > s_curr and self.position == 0:
-                signals_list[i] = SignalChange.NEUTRAL_TO_LONG
-                self.position = 1
+        macd, signal = pl.col("macd"), pl.col("signal")
+        prev_macd, prev_signal = macd.shift(1), signal.shift(1)
+        # Crossovers only count when both bars of both lines are present
+        valid = pl.all_horizontal(
+            [x.is_not_null() & x.is_not_nan() for x in (macd, prev_macd, signal, prev_signal)]
+        )
+        bullish = valid & (prev_macd <= prev_signal) & (macd > signal)
+        bearish = valid & (prev_macd >= prev_signal) & (macd < signal)
 
-            # Bearish crossover: MACD crosses below signal
-            elif m_prev >= s_prev and m_curr < s_curr and self.position == 1:
-                signals_list[i] = SignalChange.LONG_TO_NEUTRAL
-                self.position = 0
+        # Bullish cross → long, bearish cross → flat, otherwise hold (the two never
+        # coincide), so the position is a forward fill from the starting position
+        position = (
+            pl.when(bullish).then(1).when(bearish).then(0)
+            .otherwise(None).forward_fill().fill_null(self.position)
+        )
+        step = position - position.shift(1, fill_value=self.position)
+        frame = (
+            pl.LazyFrame({"macd": macd_line, "signal": signal_line})
+            .select(
+                position.alias("position"),
+                pl.when(step > 0).then(pl.lit(SignalChange.NEUTRAL_TO_LONG.value))
+                .when(step < 0).then(pl.lit(SignalChange.LONG_TO_NEUTRAL.value))
+                .otherwise(pl.lit(SignalChange.NO_CHANGE.value))
+                .cast(pl.Enum([c.value for c in SignalChange]))
+                .alias("signal_change"),
+            )
+            .collect()
+        )
+        if frame.height > 0:
+            self.position = int(frame["position"][-1])
 
-        return pl.Series(signals_list)
+        return frame["signal_change"]
 
     def create_custom_plots(self, data: pl.DataFrame, signal_result, **kwargs) -> list:
         plots = []
@@ -6,6 +6,7 @@ Fetches OHLCV for EUR/USD forex (hourly aggregates via Massive.com / Polygon API
 Set ``MASSIVE_API_KEY`` in the environment (see Massive / Polygon account).
 """
 
+import argparse
 import os
 import sys
 
@@ -28,7 +29,7 @@ EURUSD_SYMBOL = "C:EURUSD"
 BAR_INTERVAL = "1h"
 
 
-def run_insample_excellence_test():
+def run_insample_excellence_test(create_plots: bool = True):
     """Run in-sample excellence test (proof of concept)."""
     print("=== MACH4 EMA BAND EP1 — IN-SAMPLE EXCELLENCE TEST ===")
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -48,8 +49,7 @@ def run_insample_excellence_test():
         cache_dir=cache_dir,
     )
     data_handler = DataHandler(str(data_path), session_policy=session)
-    data_handler.load_data()
-    data_handler.filter_date_range(2024, 2027)
+    data_handler.load_data(start_year=2024, end_year=2027)
     data = data_handler.get_data()
 
     print(
@@ -62,8 +62,9 @@ def run_insample_excellence_test():
 
     test_metadata = test.run_test(data_handler, "insample_excellence")
 
-    signal_result = strategy.generate_signals()
-    test.create_performance_plots(data, signal_result, test_metadata["performance_results"])
+    if create_plots:
+        signal_result = strategy.generate_signals()
+        test.create_performance_plots(data, signal_result, test_metadata["performance_results"])
 
     test.generate_test_report(test_metadata)
 
@@ -77,8 +78,11 @@ def run_insample_excellence_test():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Run the in-sample excellence test")
+    parser.add_argument("--no-plots", action="store_true", help="Skip the interactive plots (faster sweeps)")
+    args = parser.parse_args()
     print("Starting mach4_ema_band_ep1 research...")
-    run_insample_excellence_test()
+    run_insample_excellence_test(create_plots=not args.no_plots)
     print("\nmach4_ema_band_ep1 research completed!")
     print("Check the results/ and plots/ directories for outputs.")
 
@@ -242,6 +242,8 @@ def _freeze_opposite_fsm(
 class EmaBandEp1Strategy(SignalBasedStrategy):
     """EMA band long/short; at most one open position; staged entry FSMs idle while exposed."""
 
+    SIGNAL_TYPE = SignalChange
+
     def __init__(self, data: pl.DataFrame, *, trade_risk: TradeRiskConfig = DEFAULT_TRADE_RISK):
         super().__init__("EMA Band EP1", data)
 
@@ -449,6 +451,7 @@ class EmaBandEp1Strategy(SignalBasedStrategy):
                     signal_result,
                     stop_loss=self._plot_stop_series,
                     take_profit=self._plot_tp_series,
+                    forward_returns=self._cached_forward_returns(data),
                 )
         return super()._calculate_strategy_returns(data, signal_result)
 
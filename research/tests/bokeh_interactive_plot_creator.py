@@ -76,6 +76,9 @@ REPORT_Y_AXIS_NUMERAL_FORMAT = "0,0.00"
 # when levels differ by pips (e.g. avoid three ticks all showing "1.16").
 REPORT_HOVER_PRICE_DECIMALS = 8
 REPORT_HOVER_PRICE_NUMERAL = "0,0.00000000"
+# Longest close / equity line sent to the browser; longer series keep each bucket's min and
+# max (see _line_decimation_index). Candles stay full resolution for zoomed-in inspection.
+REPORT_LINE_MAX_POINTS = 4000
 # Hover panel: match legend fill in _apply_report_figure_style (Bokeh tooltip reads CSS vars on body)
 REPORT_HOVER_PANEL_BG = "#121b2c"
 
@@ -116,6 +119,16 @@ except Exception:
     _PERFORMANCE_DIV_STYLESHEET = None
 
 
+# Entry markers by signal change (flips enter on their new side); exits are the *_TO_NEUTRAL changes
+_ENTRY_LABEL_BY_CHANGE = {
+    SignalChange.NEUTRAL_TO_LONG: "Long entry",
+    SignalChange.SHORT_TO_LONG: "Long entry",
+    SignalChange.NEUTRAL_TO_SHORT: "Short entry",
+    SignalChange.LONG_TO_SHORT: "Short entry",
+}
+_EXIT_SIGNAL_CHANGES = frozenset({SignalChange.LONG_TO_NEUTRAL, SignalChange.SHORT_TO_NEUTRAL})
+
+
 # Injected into saved HTML so page background is set without relying on Jinja extends.
 REPORT_PAGE_BG_MARKER = "<!-- tsf-report-page-bg -->"
 
@@ -237,6 +250,15 @@ def _report_hover_tooltip_html(rows: list[tuple[str, str]]) -> str:
     return "".join(out)
 
 
+def _report_datetime_hover(renderers: list, rows: list[tuple[str, str]]) -> HoverTool:
+    """Report-styled HoverTool for ``renderers``: a ``@timestamp`` date row, then ``rows``."""
+    return HoverTool(
+        renderers=renderers,
+        tooltips=_report_hover_tooltip_html([("Date", "@timestamp{%F}")] + rows),
+        formatters={"@timestamp": "datetime"},
+    )
+
+
 def _fmt_hover_price_optional(x) -> str:
     """Format a price for tooltips; non-finite → em dash. Up to 8 dp, trim trailing zeros."""
     if x is None:
@@ -282,15 +304,35 @@ def _fmt_metric_value(x: float) -> str:
     return f"{xf:.4f}"
 
 
-def _equity_cumprod_stable(r) -> np.ndarray:
+def _equity_from_log_returns(r) -> np.ndarray:
     """
-    Cumulative product ∏(1+r) via log1p + cumsum + exp — avoids overflow on long series
-    (plain (1+r).cum_prod() can hit inf and blank the Bokeh equity pane).
+    Growth of 1 from per-bar **log** returns: exp(cumsum(r)), non-finite bars count as 0.
+
+    Strategy and buy & hold returns are log returns (``TotalReturnMeasure`` sums them),
+    so compounding them as simple returns ((1+r).cum_prod()) would misstate the curve.
     """
     r = np.asarray(r, dtype=np.float64)
-    r = np.where(np.isfinite(r), r, 0.0)
-    r = np.clip(r, -0.999999, 50.0)
-    return np.exp(np.cumsum(np.log1p(r)))
+    return np.exp(np.cumsum(np.where(np.isfinite(r), r, 0.0)))
+
+
+def _line_decimation_index(y, max_points: int = REPORT_LINE_MAX_POINTS) -> Optional[np.ndarray]:
+    """
+    Row indices to draw a line of ``y`` with about ``max_points`` vertices, or None if it is
+    already short enough. Each bucket keeps its min and max (plus both ends), so spikes and
+    drawdowns survive where a plain stride would drop them.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= max(max_points, 2):
+        return None
+    step = -(-n // max(max_points // 2, 1))
+    # Pad the last bucket with NaN; its first value is real, so argmin/argmax stay in range
+    blocks = np.concatenate((y, np.full(-n % step, np.nan))).reshape(-1, step)
+    nan = np.isnan(blocks)
+    starts = np.arange(0, n, step)
+    lows = starts + np.argmin(np.where(nan, np.inf, blocks), axis=1)
+    highs = starts + np.argmax(np.where(nan, -np.inf, blocks), axis=1)
+    return np.unique(np.concatenate((lows, highs, [0, n - 1])))
 
 
 def _performance_summary_div(results: Dict[str, Any]) -> Div:
@@ -423,10 +465,21 @@ def _position_side_scalar(x: float) -> int:
     return 1 if x > 0 else -1
 
 
+def _position_runs(pos: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """First bar, last bar and value of each run of equal positions."""
+    if len(pos) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, np.empty(0, dtype=pos.dtype)
+    breaks = np.flatnonzero(pos[1:] != pos[:-1]) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks - 1, [len(pos) - 1]))
+    return starts, ends, pos[starts]
+
+
 def _add_trade_risk_reward_zones(
     p,
     data: pl.DataFrame,
-    signal_result,
+    pos: np.ndarray,
     stop_s: pl.Series,
     tp_s: pl.Series,
     bar_width_ms: float,
@@ -435,17 +488,11 @@ def _add_trade_risk_reward_zones(
     Draw RR profit (green) and risk (red) quads from entry bar through exit bar for each
     open position, when ``get_trade_levels_for_plot`` supplies aligned stop/take-profit.
 
-    Rendered behind price glyphs (caller should invoke before candles/lines).
+    ``pos`` is the float position array (one value per bar). Rendered behind price
+    glyphs (caller should invoke before candles/lines).
     """
     n = len(data)
-    if n == 0 or len(stop_s) != n or len(tp_s) != n:
-        return
-
-    pos = np.asarray(
-        signal_result.position_signals.cast(pl.Float64).to_numpy(),
-        dtype=np.float64,
-    )
-    if len(pos) != n:
+    if n == 0 or len(stop_s) != n or len(tp_s) != n or len(pos) != n:
         return
 
     close = np.asarray(data["close"].to_numpy(), dtype=np.float64)
@@ -559,13 +606,13 @@ class BokehInteractivePlotCreator:
         try:
             print(f"\n=== CREATING BOKEH INTERACTIVE PLOT ===")
             
-            # Prepare data
-            data_copy = data.clone()
-            # Add timestamp column if not present
-            if 'timestamp' not in data_copy.columns:
-                data_copy = data_copy.with_row_index('row_index')
-                data_copy = data_copy.with_columns(
-                    pl.col('row_index').cast(pl.Datetime).alias('timestamp')
+            # Plot from the caller's frame as-is (no clone): when it is the strategy's own
+            # data, the strategy's cached log returns are reused for the equity pane.
+            # Frames without timestamps get a row-number datetime axis in a new frame.
+            chart_data = data
+            if 'timestamp' not in chart_data.columns:
+                chart_data = chart_data.with_columns(
+                    pl.int_range(pl.len()).cast(pl.Datetime).alias('timestamp')
                 )
             
             # Create output file with versioning
@@ -592,26 +639,31 @@ class BokehInteractivePlotCreator:
             has_trade_levels = False
             stop_s = tp_s = None
             if strategy is not None:
-                levels = strategy.get_trade_levels_for_plot(data_copy, signal_result)
+                levels = strategy.get_trade_levels_for_plot(chart_data, signal_result)
             if levels is not None:
                 stop_s, tp_s = levels
-                if len(stop_s) == len(data_copy):
+                if len(stop_s) == len(chart_data):
                     has_trade_levels = True
 
-            w_ms = _median_bar_width_ms(data_copy["timestamp"])
+            # Timestamps and positions as NumPy once; every pane's sources slice these
+            ts_np = np.asarray(chart_data["timestamp"].to_numpy())
+            numeric_positions = np.asarray(
+                signal_result.position_signals.cast(pl.Float64).to_numpy(), dtype=np.float64
+            )
+
+            w_ms = _median_bar_width_ms(chart_data["timestamp"])
             if has_trade_levels and stop_s is not None and tp_s is not None:
                 _add_trade_risk_reward_zones(
-                    p1, data_copy, signal_result, stop_s, tp_s, w_ms
+                    p1, chart_data, numeric_positions, stop_s, tp_s, w_ms
                 )
 
             # Candlesticks (OHLC): one legend group, hidden by default; toggle on when zoomed
-            if all(c in data_copy.columns for c in ("open", "high", "low", "close")):
-                ts_np = data_copy["timestamp"].to_numpy()
+            if all(c in chart_data.columns for c in ("open", "high", "low", "close")):
                 # Polars <1.0: to_numpy() has no dtype= kwarg; cast via numpy
-                open_np = np.asarray(data_copy["open"].to_numpy(), dtype=np.float64)
-                high_np = np.asarray(data_copy["high"].to_numpy(), dtype=np.float64)
-                low_np = np.asarray(data_copy["low"].to_numpy(), dtype=np.float64)
-                close_np = np.asarray(data_copy["close"].to_numpy(), dtype=np.float64)
+                open_np = np.asarray(chart_data["open"].to_numpy(), dtype=np.float64)
+                high_np = np.asarray(chart_data["high"].to_numpy(), dtype=np.float64)
+                low_np = np.asarray(chart_data["low"].to_numpy(), dtype=np.float64)
+                close_np = np.asarray(chart_data["close"].to_numpy(), dtype=np.float64)
                 body_lo = np.minimum(open_np, close_np)
                 body_hi = np.maximum(open_np, close_np)
                 inc = close_np >= open_np
@@ -661,13 +713,17 @@ class BokehInteractivePlotCreator:
                     r.visible = False
 
             # Close line: ColumnDataSource so hover can show RR stop / take profit when the strategy provides them
+            close_y = np.asarray(chart_data["close"].to_numpy(), dtype=np.float64)
+            close_idx = _line_decimation_index(close_y)
+            if close_idx is None:
+                close_idx = slice(None)
             close_cds_data: dict = {
-                "timestamp": np.asarray(data_copy["timestamp"].to_numpy()),
-                "close": np.asarray(data_copy["close"].to_numpy(), dtype=np.float64),
+                "timestamp": ts_np[close_idx],
+                "close": close_y[close_idx],
             }
             if has_trade_levels and stop_s is not None and tp_s is not None:
-                sv = stop_s.to_numpy()
-                tv = tp_s.to_numpy()
+                sv = np.asarray(stop_s.to_numpy())[close_idx]
+                tv = np.asarray(tp_s.to_numpy())[close_idx]
                 close_cds_data["stop_loss_str"] = [_fmt_hover_price_optional(x) for x in sv]
                 close_cds_data["take_profit_str"] = [_fmt_hover_price_optional(x) for x in tv]
             cds_close = ColumnDataSource(data=close_cds_data)
@@ -684,55 +740,50 @@ class BokehInteractivePlotCreator:
             exit_r = None
             if has_trade_levels and stop_s is not None and tp_s is not None:
                 plot_data = signal_result.get_signal_changes_for_plotting(
-                    data_copy, stop_loss=stop_s, take_profit=tp_s
+                    chart_data, stop_loss=stop_s, take_profit=tp_s
                 )
             else:
-                plot_data = signal_result.get_signal_changes_for_plotting(data_copy)
+                plot_data = signal_result.get_signal_changes_for_plotting(chart_data)
             if len(plot_data) > 0:
-                bar_indices = plot_data["index"].to_list()
-                timestamps = plot_data["timestamp"].to_list()
-                prices = plot_data["price"].to_list()
+                # Classify by enum member (table lookups, no str() / substring scans per signal)
                 signal_changes = plot_data["signal_change"].to_list()
+                entry_labels_all = np.array(
+                    [_ENTRY_LABEL_BY_CHANGE.get(c) for c in signal_changes], dtype=object
+                )
+                is_entry = np.not_equal(entry_labels_all, None)
+                is_exit = np.fromiter(
+                    (c in _EXIT_SIGNAL_CHANGES for c in signal_changes),
+                    dtype=np.bool_,
+                    count=len(signal_changes),
+                )
+                bar_indices = plot_data["index"].to_numpy()
+                timestamps = plot_data["timestamp"].to_numpy()
+                prices = plot_data["price"].to_numpy()
 
-                entry_timestamps = []
-                entry_prices = []
-                entry_labels: list[str] = []
-                entry_sl_str: list[str] = []
-                entry_tp_str: list[str] = []
-                exit_timestamps = []
-                exit_prices = []
+                entry_timestamps = timestamps[is_entry]
+                entry_prices = prices[is_entry]
+                entry_labels = entry_labels_all[is_entry].tolist()
+                exit_timestamps = timestamps[is_exit]
+                exit_prices = prices[is_exit]
 
-                sv_arr = tv_arr = None
+                entry_bars = bar_indices[is_entry]
                 if has_trade_levels and stop_s is not None and tp_s is not None:
                     sv_arr = stop_s.to_numpy()
                     tv_arr = tp_s.to_numpy()
-
-                for j, signal in enumerate(signal_changes):
-                    signal_str = str(signal)
-                    bar_idx = int(bar_indices[j])
-                    if "TO_LONG" in signal_str or "TO_SHORT" in signal_str:
-                        entry_timestamps.append(timestamps[j])
-                        entry_prices.append(prices[j])
-                        entry_labels.append(
-                            "Long entry" if "TO_LONG" in signal_str else "Short entry"
-                        )
-                        if sv_arr is not None and tv_arr is not None and 0 <= bar_idx < len(
-                            sv_arr
-                        ):
-                            entry_sl_str.append(
-                                _fmt_hover_price_optional(sv_arr[bar_idx])
-                            )
-                            entry_tp_str.append(
-                                _fmt_hover_price_optional(tv_arr[bar_idx])
-                            )
-                        else:
-                            entry_sl_str.append("—")
-                            entry_tp_str.append("—")
-                    elif "TO_NEUTRAL" in signal_str:
-                        exit_timestamps.append(timestamps[j])
-                        exit_prices.append(prices[j])
-
-                if entry_timestamps:
+                    in_range = (entry_bars >= 0) & (entry_bars < len(sv_arr))
+                    entry_sl_str = [
+                        _fmt_hover_price_optional(sv_arr[i]) if ok else "—"
+                        for i, ok in zip(entry_bars.tolist(), in_range.tolist())
+                    ]
+                    entry_tp_str = [
+                        _fmt_hover_price_optional(tv_arr[i]) if ok else "—"
+                        for i, ok in zip(entry_bars.tolist(), in_range.tolist())
+                    ]
+                else:
+                    entry_sl_str = ["—"] * len(entry_bars)
+                    entry_tp_str = ["—"] * len(entry_bars)
+
+                if len(entry_timestamps):
                     entry_dict = dict(
                         timestamp=entry_timestamps,
                         price=entry_prices,
@@ -754,7 +805,7 @@ class BokehInteractivePlotCreator:
                         line_width=0.5,
                     )
 
-                if exit_timestamps:
+                if len(exit_timestamps):
                     exit_src = ColumnDataSource(
                         data=dict(
                             timestamp=exit_timestamps,
@@ -786,7 +837,7 @@ class BokehInteractivePlotCreator:
                 try:
                     strategy.add_price_overlays(
                         p1,
-                        data_copy,
+                        chart_data,
                         signal_result,
                         results=results,
                     )
@@ -804,42 +855,39 @@ class BokehInteractivePlotCreator:
                 x_range=p1.x_range,  # Link x-axis
             )
             
-            # Position areas (optimized, no warnings)
-            # Convert to numeric values once for efficiency
-            numeric_positions = signal_result.position_signals.cast(pl.Float64)
-            
-            p2.line(
-                data_copy["timestamp"],
-                numeric_positions,
+            position_src = ColumnDataSource(
+                data={"timestamp": ts_np, "position": numeric_positions}
+            )
+            position_r = p2.line(
+                x="timestamp",
+                y="position",
+                source=position_src,
                 line_width=2,
                 color=COLOR_POSITION_LINE,
                 legend_label="Position",
             )
 
-            # Add area fills (optimized)
-            long_mask = numeric_positions == 1
-            short_mask = numeric_positions == -1
-
-            p2.varea(
-                data_copy["timestamp"],
-                0.5,
-                np.where(long_mask, 1, np.nan),
-                color=COLOR_LONG_AREA,
-                alpha=0.22,
-                legend_label="Long",
-            )
-
-            p2.varea(
-                data_copy["timestamp"],
-                -0.5,
-                np.where(short_mask, -1, np.nan),
-                color=COLOR_SHORT_AREA,
-                alpha=0.22,
-                legend_label="Short",
-            )
+            # Area fills: one quad per run of a held position (positions are piecewise
+            # constant), and a single two-point band for the neutral zone
+            run_starts, run_ends, run_values = _position_runs(numeric_positions)
+            for value, bottom, top, color, label in (
+                (1.0, 0.5, 1.0, COLOR_LONG_AREA, "Long"),
+                (-1.0, -1.0, -0.5, COLOR_SHORT_AREA, "Short"),
+            ):
+                held = run_values == value
+                p2.quad(
+                    left=ts_np[run_starts[held]],
+                    right=ts_np[run_ends[held]],
+                    bottom=bottom,
+                    top=top,
+                    fill_color=color,
+                    fill_alpha=0.22,
+                    line_color=None,
+                    legend_label=label,
+                )
 
             p2.varea(
-                data_copy["timestamp"],
+                ts_np[[0, -1]] if len(ts_np) else ts_np,
                 -0.5,
                 0.5,
                 color=COLOR_NEUTRAL_AREA,
@@ -865,33 +913,39 @@ class BokehInteractivePlotCreator:
             )
             
             # Equity: match framework / strategy returns (includes RR exit fills when implemented).
-            numeric_signals = signal_result.position_signals.cast(pl.Float64)
+            # Next-bar log return of the close, computed once for buy & hold and the fallback.
+            log_close = np.log(np.asarray(chart_data["close"].to_numpy(), dtype=np.float64))
+            r_bh = np.full_like(log_close, np.nan)
+            r_bh[:-1] = np.diff(log_close)
             if strategy is not None and hasattr(strategy, "_calculate_strategy_returns"):
-                returns = strategy._calculate_strategy_returns(data_copy, signal_result)
+                returns = strategy._calculate_strategy_returns(chart_data, signal_result)
+                r_strat = np.asarray(returns.to_numpy(), dtype=np.float64)
             else:
-                returns = numeric_signals * np.log(data_copy["close"]).diff().shift(-1)
-            r_strat = np.asarray(returns.to_numpy(), dtype=np.float64)
-            r_bh = np.asarray(
-                (np.log(data_copy["close"]).diff().shift(-1)).to_numpy(),
-                dtype=np.float64,
-            )
-            cumulative_returns = _equity_cumprod_stable(np.nan_to_num(r_strat, nan=0.0))
-            buy_hold_returns = _equity_cumprod_stable(np.nan_to_num(r_bh, nan=0.0))
-
-            p3.line(
-                data_copy["timestamp"],
-                cumulative_returns,
-                line_width=2,
-                color=COLOR_STRATEGY_EQ,
-                legend_label="Strategy",
-            )
-            p3.line(
-                data_copy["timestamp"],
-                buy_hold_returns,
-                line_width=2,
-                color=COLOR_BUYHOLD_EQ,
-                legend_label="Buy & Hold",
-            )
+                r_strat = numeric_positions * r_bh
+            cumulative_returns = _equity_from_log_returns(r_strat)
+            buy_hold_returns = _equity_from_log_returns(r_bh)
+
+            equity_renderers = []
+            for curve, color, label in (
+                (cumulative_returns, COLOR_STRATEGY_EQ, "Strategy"),
+                (buy_hold_returns, COLOR_BUYHOLD_EQ, "Buy & Hold"),
+            ):
+                idx = _line_decimation_index(curve)
+                if idx is None:
+                    idx = slice(None)
+                equity_src = ColumnDataSource(
+                    data={"timestamp": ts_np[idx], "equity": curve[idx]}
+                )
+                equity_renderers.append(
+                    p3.line(
+                        x="timestamp",
+                        y="equity",
+                        source=equity_src,
+                        line_width=2,
+                        color=color,
+                        legend_label=label,
+                    )
+                )
 
             _apply_report_figure_style(p3)
             p3.legend.location = "top_left"
@@ -902,66 +956,32 @@ class BokehInteractivePlotCreator:
             performance_summary = _performance_summary_div(results)
 
             # Price pane: separate hovers so close line can show stop/TP columns without breaking markers
+            price_tip_rows = [("Price", f"@close{{{REPORT_HOVER_PRICE_NUMERAL}}}")]
             if has_trade_levels:
-                price_tip_rows = [
-                    ("Date", "@timestamp{%F}"),
-                    ("Price", f"@close{{{REPORT_HOVER_PRICE_NUMERAL}}}"),
+                price_tip_rows += [
                     ("Stop loss", "@stop_loss_str"),
                     ("Take profit", "@take_profit_str"),
                 ]
-            else:
-                price_tip_rows = [
-                    ("Date", "@timestamp{%F}"),
-                    ("Price", f"@close{{{REPORT_HOVER_PRICE_NUMERAL}}}"),
-                ]
-            hover_close = HoverTool(
-                renderers=[close_r],
-                tooltips=_report_hover_tooltip_html(price_tip_rows),
-            )
-            hover_close.formatters = {"@timestamp": "datetime"}
-            p1.add_tools(hover_close)
+            price_hovers = [_report_datetime_hover([close_r], price_tip_rows)]
+            marker_tip_rows = [
+                ("Price", f"@price{{{REPORT_HOVER_PRICE_NUMERAL}}}"),
+                ("Signal", "@signal_label"),
+            ]
             # Entry markers: show intended SL / TP at open (values keyed by bar index from plot_data)
             if entry_r is not None:
-                entry_tip_rows = [
-                    ("Date", "@timestamp{%F}"),
-                    ("Price", f"@price{{{REPORT_HOVER_PRICE_NUMERAL}}}"),
-                    ("Signal", "@signal_label"),
-                    ("SL", "@sl_str"),
-                    ("TP", "@tp_str"),
-                ]
-                hover_entry = HoverTool(
-                    renderers=[entry_r],
-                    tooltips=_report_hover_tooltip_html(entry_tip_rows),
+                price_hovers.append(
+                    _report_datetime_hover(
+                        [entry_r], marker_tip_rows + [("SL", "@sl_str"), ("TP", "@tp_str")]
+                    )
                 )
-                hover_entry.formatters = {"@timestamp": "datetime"}
-                p1.add_tools(hover_entry)
             if exit_r is not None:
-                hover_exit = HoverTool(
-                    renderers=[exit_r],
-                    tooltips=_report_hover_tooltip_html(
-                        [
-                            ("Date", "@timestamp{%F}"),
-                            ("Price", f"@price{{{REPORT_HOVER_PRICE_NUMERAL}}}"),
-                            ("Signal", "@signal_label"),
-                        ]
-                    ),
-                )
-                hover_exit.formatters = {"@timestamp": "datetime"}
-                p1.add_tools(hover_exit)
+                price_hovers.append(_report_datetime_hover([exit_r], marker_tip_rows))
+            p1.add_tools(*price_hovers)
 
-            hover2 = HoverTool(
-                tooltips=_report_hover_tooltip_html([("Date", "@x{%F}"), ("Position", "@y")])
-            )
-            hover2.formatters = {"@x": "datetime"}
-            p2.add_tools(hover2)
-
-            hover3 = HoverTool(
-                tooltips=_report_hover_tooltip_html(
-                    [("Date", "@x{%F}"), ("Returns", "@y{0.0000}")]
-                )
+            p2.add_tools(_report_datetime_hover([position_r], [("Position", "@position")]))
+            p3.add_tools(
+                _report_datetime_hover(equity_renderers, [("Returns", "@equity{0.0000}")])
             )
-            hover3.formatters = {"@x": "datetime"}
-            p3.add_tools(hover3)
             
             # Stack: performance summary (top) → price+signals → feature panes → position → equity
             plot_stack = [p1]
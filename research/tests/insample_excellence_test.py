@@ -28,9 +28,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from research.version_manager import VersionManager
 
-# Bokeh plotting imports
-from .bokeh_interactive_plot_creator import BokehInteractivePlotCreator
-
 
 class InSampleExcellenceTest:
     """Standardized in-sample excellence test for proof of concept validation"""
@@ -136,8 +133,9 @@ class InSampleExcellenceTest:
             except Exception as e:
                 print(f"Warning: Could not create custom plots: {e}")
         
-        # Create interactive plots with Bokeh
+        # Create interactive plots with Bokeh (imported here so runs without plots skip it)
         try:
+            from .bokeh_interactive_plot_creator import BokehInteractivePlotCreator
             bokeh_creator = BokehInteractivePlotCreator(self.plots_dir)
             
             # Create full interactive analysis
@@ -0,0 +1,74 @@
+"""Tests for framework.data_handling.DataHandler file loading."""
+
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import polars as pl
+
+from framework.data_handling import DataHandler
+
+
+def _sample_ohlcv() -> pl.DataFrame:
+    start = datetime(2023, 6, 15)
+    return pl.DataFrame(
+        {
+            "timestamp": [start + timedelta(hours=i) for i in range(4)],
+            "open": [100.0, 101.0, 102.0, 103.0],
+            "high": [101.0, 102.0, 103.0, 104.0],
+            "low": [99.0, 100.0, 101.0, 102.0],
+            "close": [100.5, 101.5, 102.5, 103.5],
+            "volume": [1_000.0] * 4,
+        }
+    )
+
+
+class LoadDataTests(unittest.TestCase):
+    def test_arrow_ipc_loads_like_parquet(self) -> None:
+        with TemporaryDirectory() as tmp:
+            parquet_path = Path(tmp) / "bars.pq"
+            ipc_path = Path(tmp) / "bars.arrow"
+            _sample_ohlcv().write_parquet(parquet_path)
+            _sample_ohlcv().write_ipc(ipc_path, compression="uncompressed")
+
+            from_parquet = DataHandler(str(parquet_path)).load_data()
+            from_ipc = DataHandler(str(ipc_path)).load_data()
+            self.assertTrue(from_ipc.equals(from_parquet))
+
+    def test_year_range_is_applied_while_reading(self) -> None:
+        hours = [datetime(2022, 12, 31, 23) + timedelta(hours=i * 4000) for i in range(6)]
+        bars = pl.DataFrame(
+            {
+                "timestamp": hours,
+                "open": [1.0] * 6,
+                "high": [1.0] * 6,
+                "low": [1.0] * 6,
+                "close": [float(i) for i in range(6)],
+                "volume": [1.0] * 6,
+            }
+        )
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bars.pq"
+            bars.write_parquet(path)
+
+            handler = DataHandler(str(path))
+            handler.load_data()
+            expected = handler.filter_date_range(2023, 2024)
+            loaded = DataHandler(str(path)).load_data(start_year=2023, end_year=2024)
+            self.assertTrue(loaded.equals(expected))
+            self.assertEqual(loaded["timestamp"].dt.year().unique().to_list(), [2023])
+
+            with self.assertRaises(ValueError):
+                pl.DataFrame({"close": [1.0]}).write_parquet(path)
+                DataHandler(str(path)).load_data(start_year=2023)
+
+    def test_unknown_extension_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            DataHandler("bars.json").load_data()
+
+
+if __name__ == "__main__":
+    unittest.main()
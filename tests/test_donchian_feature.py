@@ -0,0 +1,127 @@
+"""Tests for framework.features.DonchianFeature breakout positions."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import polars as pl
+
+from framework.features import DonchianFeature
+from framework.features import donchian_feature as donchian_module
+from framework.performance import ProfitFactorMeasure
+
+
+def _ohlcv(close: list[float]) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": [1.0] * len(close),
+        }
+    )
+
+
+class DonchianBreakoutPositionTests(unittest.TestCase):
+    def test_positions_hold_between_breakouts(self) -> None:
+        feature = DonchianFeature(_ohlcv([10.0, 11.0, 12.0, 11.5, 11.0, 9.0, 9.5, 13.0]), lookback=2)
+        positions = feature.get_breakout_positions()
+        self.assertEqual(positions.dtype, pl.Int8)
+        self.assertEqual(positions.to_list(), [0, 0, 1, 1, -1, -1, -1, 1])
+
+    def test_matches_bar_by_bar_reference(self) -> None:
+        rng = np.random.default_rng(3)
+        close = (100.0 + rng.normal(0.0, 1.0, 300).cumsum()).tolist()
+        feature = DonchianFeature(_ohlcv(close), lookback=12)
+        bands = feature.get_bands()
+        upper = bands["upper"].shift(1).to_list()
+        lower = bands["lower"].shift(1).to_list()
+
+        expected, position = [], 0
+        for price, high, low in zip(close, upper, lower):
+            if high is not None and price > high:
+                position = 1
+            elif low is not None and price < low:
+                position = -1
+            expected.append(position)
+        self.assertEqual(feature.get_breakout_positions().to_list(), expected)
+
+    def test_lookback_sweep_matches_fresh_features(self) -> None:
+        rng = np.random.default_rng(5)
+        data = _ohlcv((100.0 + rng.normal(0.0, 1.0, 200).cumsum()).tolist())
+        feature = DonchianFeature(data, lookback=20)
+        for lookback in (5, 12, 30):
+            expected = DonchianFeature(data, lookback=lookback).get_breakout_positions()
+            self.assertTrue(feature.get_breakout_positions(lookback).equals(expected))
+
+        # New data must not reuse the previous close prices
+        feature.set_data(data.head(50))
+        self.assertEqual(len(feature.get_breakout_positions()), 50)
+
+    def test_position_grid_matches_single_lookbacks(self) -> None:
+        rng = np.random.default_rng(8)
+        close = 100.0 + rng.normal(0.0, 1.0, 150).cumsum()
+        data = _ohlcv(close.tolist()).with_columns(
+            pl.Series("high", close + rng.random(150)), pl.Series("low", close - rng.random(150))
+        )
+        feature = DonchianFeature(data, lookback=20)
+        lookbacks = [1, 4, 12, 40]
+        expected = [feature.get_breakout_positions(lookback).to_list() for lookback in lookbacks]
+
+        grid = feature.get_breakout_position_grid(lookbacks)
+        self.assertEqual(grid.dtype, np.int8)
+        self.assertEqual(grid.tolist(), expected)
+        with mock.patch.object(donchian_module, "NUMBA_AVAILABLE", False):
+            self.assertEqual(feature.get_breakout_position_grid(lookbacks).tolist(), expected)
+        with self.assertRaises(ValueError):
+            feature.get_breakout_position_grid([0])
+
+    def test_nan_prices_give_the_same_results_on_both_paths(self) -> None:
+        # A window holding NaN (or null) has no band, as in polars' rolling max / min
+        close = [1.0, 2.0, float("nan"), 3.0, 2.5, 4.0, 1.0, 0.5]
+        feature = DonchianFeature(_ohlcv(close), lookback=2)
+        self.assertEqual(feature.get_breakout_positions().to_list(), [0, 0, 0, 0, 0, 1, -1, -1])
+        self.assertEqual(feature.get_breakout_position_grid([2]).tolist(), [[0, 0, 0, 0, 0, 1, -1, -1]])
+
+        rng = np.random.default_rng(12)
+        lookbacks = [1, 2, 3, 7]
+        for _ in range(200):
+            n = int(rng.integers(1, 60))
+            close = 100.0 + rng.normal(0.0, 1.0, n).cumsum()
+            prices = [close, close + rng.random(n), close - rng.random(n)]
+            for values in prices:
+                values[rng.random(n) < 0.1] = np.nan
+            data = _ohlcv(prices[0].tolist()).with_columns(
+                pl.Series("high", prices[1]).fill_nan(None), pl.Series("low", prices[2])
+            )
+            feature = DonchianFeature(data, lookback=3)
+            grid = feature.get_breakout_position_grid(lookbacks)
+            profit_factors = feature.get_breakout_profit_factors(lookbacks)
+            with mock.patch.object(donchian_module, "NUMBA_AVAILABLE", False):
+                self.assertEqual(feature.get_breakout_position_grid(lookbacks).tolist(), grid.tolist())
+                np.testing.assert_allclose(feature.get_breakout_profit_factors(lookbacks), profit_factors)
+
+    def test_profit_factors_match_profit_factor_measure(self) -> None:
+        rng = np.random.default_rng(9)
+        close = 100.0 + rng.normal(0.0, 1.0, 200).cumsum()
+        data = _ohlcv(close.tolist()).with_columns(
+            pl.Series("high", close + rng.random(200)), pl.Series("low", close - rng.random(200))
+        )
+        feature = DonchianFeature(data, lookback=20)
+        lookbacks = [3, 10, 25]
+        forward = data["close"].log().diff().shift(-1).fill_null(0.0)
+        expected = [
+            ProfitFactorMeasure().calculate(feature.get_breakout_positions(lookback) * forward)
+            for lookback in lookbacks
+        ]
+
+        np.testing.assert_allclose(feature.get_breakout_profit_factors(lookbacks), expected)
+        with mock.patch.object(donchian_module, "NUMBA_AVAILABLE", False):
+            np.testing.assert_allclose(feature.get_breakout_profit_factors(lookbacks), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,17 @@ class OhlcColumnTests(unittest.TestCase):
         m = MacdFeature(df, fast_period=3, slow_period=5, signal_period=2, column="low")
         self.assertEqual(m.column, "low")
 
+    def test_macd_param_sweep_reuses_price_emas(self) -> None:
+        df = _sample_ohlcv().with_columns((pl.col("close") * 1.01).sin().alias("close"))
+        m = MacdFeature(df, fast_period=3, slow_period=8, signal_period=2)
+        for fast, slow in ((4, 8), (3, 10), (4, 10)):
+            m.set_params(fast_period=fast, slow_period=slow)
+            fresh = MacdFeature(df, fast_period=fast, slow_period=slow, signal_period=2)
+            self.assertTrue(m.get_macd_line().equals(fresh.get_macd_line()))
+            self.assertTrue(m.get_signal().equals(fresh.get_signal()))
+        # One EMA per distinct period, not two per combination
+        self.assertEqual(sorted(period for _, period in m._ema_cache), [3, 4, 8, 10])
+
 
 if __name__ == "__main__":
     unittest.main()
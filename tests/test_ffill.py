@@ -0,0 +1,29 @@
+"""Tests for the shared sparse signal forward fill."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from framework._ffill import ffill_sparse_signal
+
+
+class FfillSparseSignalTests(unittest.TestCase):
+    def test_events_are_held_until_the_next_event(self) -> None:
+        long = np.array([False, True, False, False, True, False])
+        short = np.array([False, False, False, True, True, False])
+        signal = ffill_sparse_signal(long, short)
+        # A long event wins over a short event on the same bar
+        self.assertEqual(signal.tolist(), [0, 1, 1, -1, 1, 1])
+        self.assertEqual(signal.dtype, np.int8)
+
+    def test_initial_and_short_value(self) -> None:
+        long = np.array([False, False, True, False])
+        short = np.array([False, True, False, False])
+        self.assertEqual(ffill_sparse_signal(long, short, initial=1, short_value=0).tolist(), [1, 0, 1, 1])
+        self.assertEqual(ffill_sparse_signal(np.zeros(0, bool), np.zeros(0, bool)).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for framework.significance_testing.MonteCarloSignificanceTest."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import polars as pl
+
+from framework.significance_testing import MonteCarloSignificanceTest
+from framework.significance_testing import monte_carlo_significance_test as mc_module
+
+
+class MonteCarloSignificanceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(7)
+        self.returns = pl.Series(rng.normal(0.0005, 0.01, 250))
+
+    def test_batch_metrics_match_series_metrics(self) -> None:
+        mc = MonteCarloSignificanceTest(n_permutations=10, random_seed=1)
+        rows = np.vstack([self.returns.to_numpy(), self.returns.to_numpy()[::-1]])
+        for metric in ("sharpe", "profit_factor", "total_return", "max_drawdown"):
+            batch = mc._calculate_metric_batch(rows, metric)
+            for row, value in zip(rows, batch):
+                self.assertAlmostEqual(value, mc._calculate_metric(pl.Series(row), metric), places=10)
+
+    def test_seeded_runs_are_reproducible_and_permutations_differ(self) -> None:
+        first = MonteCarloSignificanceTest(n_permutations=50, random_seed=3).test(
+            None, self.returns, metric="max_drawdown"
+        )
+        second = MonteCarloSignificanceTest(n_permutations=50, random_seed=3).test(
+            None, self.returns, metric="max_drawdown"
+        )
+        self.assertEqual(first["p_value"], second["p_value"])
+        self.assertGreater(first["std_random_metric"], 0.0)
+        self.assertEqual(first["n_permutations"], 50)
+        self.assertFalse(first["degenerate_test"])
+
+    def test_default_runs_in_process(self) -> None:
+        with mock.patch.object(mc_module, "NUMBA_AVAILABLE", False), mock.patch.object(
+            mc_module, "ProcessPoolExecutor"
+        ) as pool:
+            MonteCarloSignificanceTest(n_permutations=10, random_seed=0).test(
+                None, self.returns, metric="max_drawdown"
+            )
+            pool.assert_not_called()
+
+    def test_results_do_not_depend_on_n_jobs(self) -> None:
+        # Force several batches (and the no-Numba path) so the process pool is exercised
+        with mock.patch.object(mc_module, "_MAX_BATCH_ELEMENTS", 2_500), mock.patch.object(
+            mc_module, "NUMBA_AVAILABLE", False
+        ):
+            serial = MonteCarloSignificanceTest(n_permutations=40, random_seed=5, n_jobs=1).test(
+                None, self.returns, metric="max_drawdown"
+            )
+            parallel = MonteCarloSignificanceTest(n_permutations=40, random_seed=5, n_jobs=2).test(
+                None, self.returns, metric="max_drawdown"
+            )
+        self.assertEqual(serial["p_value"], parallel["p_value"])
+        self.assertEqual(serial["mean_random_metric"], parallel["mean_random_metric"])
+
+    def test_nulls_are_ignored(self) -> None:
+        returns = pl.Series([0.01, None, -0.02, 0.03, None])
+        result = MonteCarloSignificanceTest(n_permutations=20, random_seed=0).test(
+            None, returns, metric="max_drawdown"
+        )
+        self.assertAlmostEqual(result["actual_metric"], -0.02)
+        self.assertTrue(-0.02 - 1e-12 <= result["mean_random_metric"] <= 0.0)
+
+    def test_order_invariant_metrics_skip_permutation(self) -> None:
+        with self.assertWarns(UserWarning):
+            result = MonteCarloSignificanceTest(n_permutations=100, random_seed=0).test(
+                None, self.returns, metric="sharpe"
+            )
+        self.assertTrue(result["degenerate_test"])
+        self.assertEqual(result["p_value"], 1.0)
+        self.assertFalse(result["is_significant"])
+        self.assertEqual(result["std_random_metric"], 0.0)
+        self.assertAlmostEqual(result["mean_random_metric"], result["actual_metric"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""Tests for framework.features.RSIFeature parameter updates."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import polars as pl
+
+from framework.features import RSIFeature
+from framework.features import rsi_feature as rsi_module
+
+
+class RsiFeatureParamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        close = 100.0 + np.random.default_rng(4).normal(0.0, 1.0, 100).cumsum()
+        self.data = pl.DataFrame(
+            {"open": close, "high": close, "low": close, "close": close, "volume": np.ones(100)}
+        )
+
+    def test_threshold_changes_reuse_rsi_values(self) -> None:
+        feature = RSIFeature(self.data, period=14)
+        with mock.patch.object(RSIFeature, "calculate", wraps=feature.calculate) as calc:
+            feature.set_params(oversold=20.0, overbought=80.0)
+            feature.get_values()
+            self.assertEqual(calc.call_count, 0)
+            self.assertEqual(feature.get_oversold_signals().sum(), (feature.get_values() < 20.0).sum())
+
+            feature.set_params(period=14)
+            feature.get_values()
+            self.assertEqual(calc.call_count, 0)
+
+    def test_period_change_recalculates(self) -> None:
+        feature = RSIFeature(self.data, period=14)
+        feature.set_params(period=7)
+        self.assertEqual(feature.period, 7)
+        self.assertTrue(feature.get_values().equals(RSIFeature(self.data, period=7).get_values()))
+
+    def test_each_period_is_calculated_once_per_data(self) -> None:
+        feature = RSIFeature(self.data, period=14)
+        with mock.patch.object(RSIFeature, "_calculate_rsi", wraps=feature._calculate_rsi) as calc:
+            for period in (7, 14, 7, 21, 14):
+                feature.set_params(period=period)
+                feature.get_values()
+            self.assertEqual(calc.call_count, 2)
+
+            feature.set_data(self.data.with_columns(pl.col("close") * 2.0))
+            self.assertEqual(calc.call_count, 3)
+
+    def test_compiled_rsi_matches_polars_expressions(self) -> None:
+        compiled = RSIFeature(self.data, period=14).get_values()
+        with mock.patch.object(rsi_module, "NUMBA_AVAILABLE", False):
+            expressions = RSIFeature(self.data, period=14).get_values()
+        self.assertEqual(compiled.name, expressions.name)
+        np.testing.assert_allclose(compiled.to_numpy(), expressions.to_numpy(), atol=1e-9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for the shared RSI breakout state machine."""
+
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from framework.strategies._rsi_loop import _rsi_positions_vectorized, _rsi_state_machine
+
+
+class RsiStateMachineTests(unittest.TestCase):
+    def test_enters_on_oversold_breakout_and_exits_on_overbought_breakdown(self) -> None:
+        rsi = np.array([25.0, 35.0, 50.0, 75.0, 65.0, 50.0])
+        positions = _rsi_state_machine(rsi, 30.0, 70.0, 0)
+        self.assertEqual(positions.tolist(), [0, 1, 1, 1, 0, 0])
+        self.assertEqual(positions.dtype, np.int8)
+
+    def test_nan_bars_hold_position(self) -> None:
+        rsi = np.array([25.0, np.nan, 35.0, 25.0, 35.0])
+        # The crossing spans a NaN bar, so only the final crossing enters
+        self.assertEqual(_rsi_state_machine(rsi, 30.0, 70.0, 0).tolist(), [0, 0, 0, 0, 1])
+
+    def test_starting_position_is_carried(self) -> None:
+        rsi = np.array([80.0, 60.0, 25.0, 35.0])
+        self.assertEqual(_rsi_state_machine(rsi, 30.0, 70.0, 1).tolist(), [1, 0, 0, 1])
+        self.assertEqual(_rsi_state_machine(np.empty(0), 30.0, 70.0, 1).tolist(), [])
+
+    def test_vectorized_positions_match_state_machine(self) -> None:
+        rng = np.random.default_rng(11)
+        for _ in range(200):
+            rsi = rng.uniform(0.0, 100.0, 60)
+            rsi[rng.random(60) < 0.1] = np.nan
+            # Overlapping thresholds make both crossings fire on one bar
+            for oversold, overbought in ((30.0, 70.0), (60.0, 40.0)):
+                for position in (0, 1):
+                    expected = _rsi_state_machine(rsi, oversold, overbought, position)
+                    actual = _rsi_positions_vectorized(rsi, oversold, overbought, position)
+                    self.assertEqual(actual.dtype, np.int8)
+                    self.assertEqual(actual.tolist(), expected.tolist())
+        self.assertEqual(_rsi_positions_vectorized(np.empty(0), 30.0, 70.0, 1).tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+"""Tests for SignalManager position transitions and SignalResult summaries."""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import polars as pl
+
+from framework.signals import (
+    SIGNAL_CHANGE_DTYPE,
+    PositionState,
+    SignalChange,
+    SignalManager,
+    SignalResult,
+    calculate_strategy_returns,
+)
+from framework.strategies import BaseStrategy, SignalBasedStrategy
+
+
+class SignalManagerTests(unittest.TestCase):
+    def test_change_positions_track_real_changes_only(self) -> None:
+        raw = pl.Series(
+            [
+                SignalChange.NO_CHANGE,
+                SignalChange.NEUTRAL_TO_LONG,
+                SignalChange.NO_CHANGE,
+                SignalChange.LONG_TO_SHORT,
+                SignalChange.NO_CHANGE,
+            ],
+            dtype=pl.Object,
+        )
+        exits = pl.Series([False, False, False, False, True])
+        result = SignalManager().generate_signals(raw, exits)
+
+        self.assertEqual(result.position_signals.to_list(), [0, 1, 1, -1, 0])
+        self.assertEqual(result.position_signals.dtype, pl.Int8)
+        self.assertEqual(result.position_array.dtype, np.int8)
+        self.assertEqual(result.change_positions.tolist(), [1, 3, 4])
+        self.assertEqual(result.signal_changes[4], SignalChange.SHORT_TO_NEUTRAL.value)
+
+    def test_signal_change_counts_include_no_change(self) -> None:
+        raw = pl.Series(
+            [SignalChange.NO_CHANGE, SignalChange.NEUTRAL_TO_LONG, SignalChange.LONG_TO_NEUTRAL],
+            dtype=pl.Object,
+        )
+        counts = SignalManager().generate_signals(raw).get_signal_change_counts()
+        self.assertEqual(
+            counts,
+            {"NEUTRAL_TO_LONG": 1, "LONG_TO_NEUTRAL": 1, "NO_CHANGE": 1},
+        )
+
+    def test_change_codes_back_an_enum_view(self) -> None:
+        raw = pl.Series([0, 1, 1, -1, 0], dtype=pl.Int8)
+        result = SignalManager().generate_signals(raw, signal_type=PositionState)
+        self.assertEqual(result.change_codes.dtype, np.int8)
+        self.assertEqual(result.signal_changes.dtype, SIGNAL_CHANGE_DTYPE)
+        np.testing.assert_array_equal(result.signal_changes.to_physical().to_numpy(), result.change_codes)
+        self.assertEqual(
+            [SignalChange(v).code for v in result.signal_changes.to_list()], result.change_codes.tolist()
+        )
+
+        # Counts from the codes match counts from the strings
+        strings = SignalResult(result.position_signals, result.signal_changes.cast(pl.String))
+        self.assertEqual(result.get_signal_change_counts(), strings.get_signal_change_counts())
+
+    def test_change_positions_computed_when_not_supplied(self) -> None:
+        sr = SignalResult(
+            position_signals=pl.Series([0, 1, 1]),
+            signal_changes=pl.Series(["NO_CHANGE", "NEUTRAL_TO_LONG", None]),
+        )
+        np.testing.assert_array_equal(sr._get_change_positions(), [1])
+        self.assertEqual(len(sr.get_signal_changes_for_plotting()), 1)
+
+    def test_position_state_inputs_follow_transition_table(self) -> None:
+        raw = pl.Series(
+            [
+                PositionState.NEUTRAL,
+                PositionState.LONG,
+                PositionState.SHORT,
+                PositionState.SHORT,
+                PositionState.NEUTRAL,
+            ],
+            dtype=pl.Object,
+        )
+        result = SignalManager().generate_signals(raw, signal_type=PositionState)
+
+        self.assertEqual(result.position_signals.to_list(), [0, 1, -1, -1, 0])
+        self.assertEqual(
+            result.signal_changes.to_list(),
+            ["NO_CHANGE", "NEUTRAL_TO_LONG", "LONG_TO_SHORT", "NO_CHANGE", "SHORT_TO_NEUTRAL"],
+        )
+
+    def test_native_columns_encode_without_object_walk(self) -> None:
+        strings = pl.Series(["NEUTRAL_TO_SHORT", None, "bogus", "SHORT_TO_NEUTRAL"])
+        result = SignalManager().generate_signals(strings)
+        self.assertEqual(result.position_signals.to_list(), [-1, -1, -1, 0])
+
+        # A list of PositionState members becomes an Int64 column in polars
+        states = pl.Series([PositionState.LONG, PositionState.LONG, PositionState.NEUTRAL])
+        result = SignalManager().generate_signals(states)
+        self.assertEqual(result.position_signals.to_list(), [1, 1, 0])
+
+        with self.assertRaises(ValueError):
+            SignalManager().generate_signals(pl.Series([0, 2]), signal_type=PositionState)
+
+    def test_integer_change_codes_skip_string_encoding(self) -> None:
+        changes = [SignalChange.NEUTRAL_TO_LONG, SignalChange.NO_CHANGE, SignalChange.LONG_TO_NEUTRAL]
+        codes = pl.Series(np.array([change.code for change in changes], dtype=np.int8))
+        expected = SignalManager().generate_signals(pl.Series([c.value for c in changes]))
+        result = SignalManager().generate_signals(codes, signal_type=SignalChange)
+        self.assertEqual(result.position_signals.to_list(), expected.position_signals.to_list())
+        self.assertEqual(result.signal_changes.to_list(), expected.signal_changes.to_list())
+
+        with self.assertRaises(ValueError):
+            SignalManager().generate_signals(pl.Series([0, 7], dtype=pl.Int8), signal_type=SignalChange)
+
+    def test_object_helpers_match_tables(self) -> None:
+        manager = SignalManager()
+        manager.current_position = PositionState.SHORT
+        self.assertEqual(
+            manager._position_state_to_signal_change(PositionState.LONG), SignalChange.SHORT_TO_LONG
+        )
+        self.assertEqual(manager._apply_signal_change("NO_CHANGE"), PositionState.SHORT)
+        self.assertEqual(manager._apply_signal_change("bogus"), PositionState.SHORT)
+        self.assertEqual(
+            manager._apply_signal_change(SignalChange.NEUTRAL_TO_LONG), PositionState.LONG
+        )
+
+
+class StrategyReturnsTests(unittest.TestCase):
+    def test_rr_exit_fills_do_not_mutate_input_data(self) -> None:
+        data = pl.DataFrame(
+            {
+                "high": [101.0, 101.0, 100.0, 100.0],
+                "low": [99.0, 99.0, 89.0, 94.0],
+                "close": [100.0, 100.0, 95.0, 95.0],
+                "return": [0.0, float(np.log(0.95)), 0.0, None],
+            }
+        )
+        before = data.clone()
+        result = SignalManager().generate_signals(pl.Series([0, 1, 0, 0]), signal_type=PositionState)
+        stop_loss = pl.Series([float("nan"), 90.0, float("nan"), float("nan")])
+        take_profit = pl.Series([float("nan"), 120.0, float("nan"), float("nan")])
+
+        returns = calculate_strategy_returns(data, result, stop_loss=stop_loss, take_profit=take_profit)
+        # The exit bar's forward return is the stop fill, not the close
+        self.assertAlmostEqual(returns[1], float(np.log(0.90)))
+        self.assertTrue(data.equals(before))
+
+
+class _ArrayPositionStrategy(SignalBasedStrategy):
+    def generate_raw_signal(self, **kwargs) -> np.ndarray:
+        return np.array([0, 1, 1, 0, -1], dtype=np.int8)
+
+
+class SignalBasedStrategyTests(unittest.TestCase):
+    def test_numpy_raw_signals_are_position_states(self) -> None:
+        strategy = _ArrayPositionStrategy("array", pl.DataFrame({"close": [1.0, 2.0, 3.0, 4.0, 5.0]}))
+        result = strategy.generate_signals()
+        self.assertEqual(result.position_signals.to_list(), [0, 1, 1, 0, -1])
+        self.assertEqual(
+            result.signal_changes.to_list(),
+            ["NO_CHANGE", "NEUTRAL_TO_LONG", "NO_CHANGE", "LONG_TO_NEUTRAL", "NEUTRAL_TO_SHORT"],
+        )
+
+    def test_signal_type_is_detected_once_or_declared(self) -> None:
+        strategy = _ArrayPositionStrategy("array", pl.DataFrame({"close": [1.0, 2.0, 3.0, 4.0, 5.0]}))
+        strategy.generate_signals()
+        self.assertIs(strategy._signal_type, PositionState)
+
+        class Declared(_ArrayPositionStrategy):
+            SIGNAL_TYPE = PositionState
+
+        declared = Declared("declared", pl.DataFrame({"close": [1.0] * 5}))
+        with mock.patch.object(Declared, "_detect_signal_type") as detect:
+            declared.generate_signals()
+            detect.assert_not_called()
+
+    def test_integer_change_codes_are_not_read_as_positions(self) -> None:
+        codes = np.array(
+            [SignalChange.NO_CHANGE.code, SignalChange.NEUTRAL_TO_LONG.code, SignalChange.LONG_TO_SHORT.code],
+            dtype=np.int8,
+        )
+        result = SignalManager().generate_signals(pl.Series(codes))
+        self.assertEqual(result.position_signals.to_list(), [0, 1, -1])
+
+        class CodeStrategy(SignalBasedStrategy):
+            def generate_raw_signal(self, **kwargs) -> np.ndarray:
+                return codes
+
+        strategy = CodeStrategy("codes", pl.DataFrame({"close": [1.0, 2.0, 3.0]}))
+        self.assertEqual(strategy.generate_signals().position_signals.to_list(), [0, 1, -1])
+        self.assertIs(strategy._signal_type, SignalChange)
+
+    def test_exit_hook_is_only_called_when_overridden(self) -> None:
+        data = pl.DataFrame({"close": [1.0] * 5})
+        with mock.patch.object(SignalBasedStrategy, "generate_exit_conditions") as hook:
+            _ArrayPositionStrategy("array", data).generate_signals()
+            hook.assert_not_called()
+
+        class WithExits(_ArrayPositionStrategy):
+            def generate_exit_conditions(self, data, raw_signals=None, **kwargs):
+                return pl.Series([False, False, True, False, False])
+
+        result = WithExits("exits", data).generate_signals()
+        self.assertEqual(result.position_signals.to_list(), [0, 1, 0, 0, -1])
+
+    def test_strategy_returns_reuse_cached_log_returns(self) -> None:
+        data = pl.DataFrame({"close": [100.0, 101.0, 99.0, 102.0, 103.0]})
+        strategy = _ArrayPositionStrategy("array", data)
+        result = strategy.generate_signals()
+        expected = calculate_strategy_returns(data, result)
+        self.assertEqual(strategy._calculate_strategy_returns(data, result).to_list(), expected.to_list())
+        cached = strategy._log_returns
+        strategy._calculate_strategy_returns(data, result)
+        self.assertIs(strategy._log_returns, cached)
+
+        # Reassigning the data invalidates the cache
+        strategy.data = data.with_columns(pl.col("close") * 2.0)
+        strategy._calculate_strategy_returns(strategy.data, result)
+        self.assertIsNot(strategy._log_returns, cached)
+
+
+class _ArraySignalStrategy(BaseStrategy):
+    def generate_signals(self, **kwargs) -> np.ndarray:
+        return np.array([0.0, 1.0, 1.0, -1.0, 0.0])
+
+
+class BaseStrategyTests(unittest.TestCase):
+    def test_run_strategy_keeps_cached_log_returns(self) -> None:
+        strategy = _ArraySignalStrategy("array", pl.DataFrame({"close": [100.0, 101.0, 99.0, 102.0, 103.0]}))
+        first = strategy.run_strategy()
+        cached = strategy._log_returns
+        self.assertIsNotNone(cached)
+
+        # Adding the signal column again must not recompute the log returns
+        strategy.returns = None
+        second = strategy.run_strategy()
+        self.assertIs(strategy._log_returns, cached)
+        self.assertEqual(second["performance"], first["performance"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import unittest
 
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
 import polars as pl
 
-from framework.signals import SignalChange, SignalResult
+from framework.signals import SignalChange, SignalResult, plot_position_states, plot_signals
 
 
 class SignalPlottingTests(unittest.TestCase):
@@ -72,6 +77,78 @@ class SignalPlottingTests(unittest.TestCase):
         ]
         self.assertAlmostEqual(exit_prices[0], 95.0)
 
+    def test_plot_frame_is_cached_per_input_objects(self) -> None:
+        data = pl.DataFrame({"timestamp": [0, 1, 2], "close": [100.0, 100.0, 95.0]})
+        sr = SignalResult(
+            position_signals=pl.Series([0, 1, 0], dtype=pl.Int8),
+            signal_changes=pl.Series(["NO_CHANGE", "NEUTRAL_TO_LONG", "LONG_TO_NEUTRAL"]),
+        )
+        first = sr.get_signal_changes_for_plotting(data)
+        self.assertIs(sr.get_signal_changes_for_plotting(data), first)
+        other = sr.get_signal_changes_for_plotting(data.with_columns(pl.col("close") * 2.0))
+        self.assertIsNot(other, first)
+        self.assertEqual(other["price"].to_list(), [200.0, 190.0])
+
+    def test_changes_past_the_data_fall_back_to_index_and_zero_price(self) -> None:
+        sr = SignalResult(
+            position_signals=pl.Series([0, 1, 1, 0], dtype=pl.Int8),
+            signal_changes=pl.Series(["NO_CHANGE", "NEUTRAL_TO_LONG", "NO_CHANGE", "LONG_TO_NEUTRAL"]),
+        )
+        data = pl.DataFrame({"timestamp": [10, 11], "close": [100.0, 101.0]})
+        plot_df = sr.get_signal_changes_for_plotting(data)
+        self.assertEqual(plot_df["timestamp"].to_list(), [11, 3])
+        self.assertEqual(plot_df["price"].to_list(), [101.0, 0.0])
+
+        # A datetime column keeps its dtype; the out-of-range row has no timestamp
+        timestamps = pl.datetime_range(pl.datetime(2024, 1, 1), pl.datetime(2024, 1, 2), "1d", eager=True)
+        dated = pl.DataFrame({"timestamp": timestamps, "close": [100.0, 101.0]})
+        plot_df = sr.get_signal_changes_for_plotting(dated)
+        self.assertEqual(plot_df["timestamp"].dtype, dated["timestamp"].dtype)
+        self.assertIsNone(plot_df["timestamp"][1])
+        self.assertEqual(plot_df["price"].to_list(), [101.0, 0.0])
+
+    def test_long_to_short_flip_plots_as_short_entry(self) -> None:
+        self.assertTrue(SignalChange.LONG_TO_SHORT.is_entry)
+        self.assertEqual(SignalChange.LONG_TO_SHORT.plot_color, "red")
+        self.assertEqual(SignalChange.LONG_TO_SHORT.plot_marker, "v")
+        self.assertEqual(SignalChange.SHORT_TO_LONG.plot_color, "green")
+        self.assertEqual(SignalChange.SHORT_TO_NEUTRAL.plot_marker, "x")
+        self.assertFalse(SignalChange.NO_CHANGE.is_entry or SignalChange.NO_CHANGE.is_exit)
+
+    def test_position_states_draw_one_bar_per_run(self) -> None:
+        sr = SignalResult(
+            position_signals=pl.Series([0, 0, 1, 1, 1, -1, 0, 0], dtype=pl.Int8),
+            signal_changes=pl.Series(["NO_CHANGE"] * 8),
+        )
+        fig, ax = plt.subplots()
+        try:
+            plot_position_states(pl.DataFrame({"close": [1.0] * 8}), sr, ax=ax)
+            bars = {c.get_label(): c.get_paths() for c in ax.collections}
+            self.assertEqual(len(bars["Long Position"]), 1)
+            self.assertEqual(len(bars["Short Position"]), 1)
+            self.assertEqual(len(bars["Neutral Position"]), 2)
+            long_x = bars["Long Position"][0].vertices[:, 0]
+            self.assertEqual((long_x.min(), long_x.max()), (2.0, 4.0))
+        finally:
+            plt.close(fig)
+
+    def test_plot_signals_scatters_once_per_signal_type(self) -> None:
+        data = pl.DataFrame({"timestamp": [0, 1, 2, 3, 4], "close": [10.0, 11.0, 12.0, 13.0, 14.0]})
+        sr = SignalResult(
+            position_signals=pl.Series([0, 1, 0, 1, 0], dtype=pl.Int8),
+            signal_changes=pl.Series(
+                ["NO_CHANGE", "NEUTRAL_TO_LONG", "LONG_TO_NEUTRAL", "NEUTRAL_TO_LONG", "LONG_TO_NEUTRAL"]
+            ),
+        )
+        fig, ax = plt.subplots()
+        try:
+            plot_signals(data, sr, ax=ax)
+            scatters = {c.get_label(): c.get_offsets() for c in ax.collections}
+            self.assertEqual(list(scatters), ["NEUTRAL_TO_LONG", "LONG_TO_NEUTRAL"])
+            self.assertEqual(scatters["NEUTRAL_TO_LONG"].tolist(), [[1.0, 11.0], [3.0, 13.0]])
+        finally:
+            plt.close(fig)
+
 
 if __name__ == "__main__":
     unittest.main()
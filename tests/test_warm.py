@@ -0,0 +1,49 @@
+"""Tests for framework._warm."""
+
+from __future__ import annotations
+
+import unittest
+
+from framework._njit import NUMBA_AVAILABLE
+from framework._warm import warm_kernels
+
+
+def _warmed_kernels() -> dict:
+    """Compiled entry points ``warm_kernels`` is meant to specialize, by name"""
+    from framework import signals
+    from framework.features import donchian_feature, rsi_feature
+    from framework.performance import profit_factor_measure
+    from framework.significance_testing import monte_carlo_significance_test
+    from framework.strategies import _rsi_loop
+
+    # _breakout_scan is only called from inside the Donchian grid kernels; when those
+    # load from the on-disk cache it is never compiled on its own, so its callers are checked
+    return {
+        "_gross_profit_loss": profit_factor_measure._gross_profit_loss,
+        "_wilder_rsi": rsi_feature._wilder_rsi,
+        "_rsi_state_machine": _rsi_loop._rsi_state_machine,
+        "_breakout_position_grid": donchian_feature._breakout_position_grid,
+        "_breakout_profit_factors": donchian_feature._breakout_profit_factors,
+        "_run_state_machine": signals._run_state_machine,
+        "_max_drawdown": monte_carlo_significance_test._max_drawdown,
+        "_max_drawdown_rows": monte_carlo_significance_test._max_drawdown_rows,
+    }
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "Numba is not installed")
+class WarmKernelsTests(unittest.TestCase):
+    def test_warm_kernels_compiles_every_entry_point(self) -> None:
+        warm_kernels()
+        kernels = _warmed_kernels()
+        signatures = {name: list(kernel.signatures) for name, kernel in kernels.items()}
+        for name, sigs in signatures.items():
+            self.assertTrue(sigs, f"{name} was not compiled")
+
+        # The second run must only hit already compiled specializations
+        warm_kernels()
+        for name, kernel in kernels.items():
+            self.assertEqual(list(kernel.signatures), signatures[name], name)
+
+
+if __name__ == "__main__":
+    unittest.main()